@@ -42,12 +42,15 @@ from shinkoku.tools.ledger import (
     ledger_add_fx_loss_carryforward,
     ledger_add_fx_trading,
     ledger_add_housing_loan_detail,
+    ledger_add_housing_loan_details_batch,
     ledger_add_insurance_policy,
     ledger_add_journal,
     ledger_add_journals_batch,
     ledger_audit_log,
     ledger_add_loss_carryforward,
+    ledger_add_loss_carryforwards_batch,
     ledger_add_medical_expense,
+    ledger_add_medical_expenses_batch,
     ledger_add_other_income,
     ledger_add_professional_fee,
     ledger_add_rent_detail,
@@ -423,6 +426,16 @@ def cmd_lc_add(args: argparse.Namespace) -> None:
     )
 
 
+def cmd_lc_add_batch(args: argparse.Namespace) -> None:
+    data = _load_json(args.input)
+    details = [LossCarryforwardInput(**item) for item in data]
+    _output(
+        ledger_add_loss_carryforwards_batch(
+            db_path=args.db_path, fiscal_year=args.fiscal_year, details=details
+        )
+    )
+
+
 def cmd_lc_list(args: argparse.Namespace) -> None:
     _output(ledger_list_loss_carryforward(db_path=args.db_path, fiscal_year=args.fiscal_year))
 
@@ -448,6 +461,16 @@ def cmd_me_add(args: argparse.Namespace) -> None:
     )
 
 
+def cmd_me_add_batch(args: argparse.Namespace) -> None:
+    data = _load_json(args.input)
+    details = [MedicalExpenseInput(**item) for item in data]
+    _output(
+        ledger_add_medical_expenses_batch(
+            db_path=args.db_path, fiscal_year=args.fiscal_year, details=details
+        )
+    )
+
+
 def cmd_me_list(args: argparse.Namespace) -> None:
     _output(ledger_list_medical_expenses(db_path=args.db_path, fiscal_year=args.fiscal_year))
 
@@ -492,6 +515,16 @@ def cmd_hl_add(args: argparse.Namespace) -> None:
     )
 
 
+def cmd_hl_add_batch(args: argparse.Namespace) -> None:
+    data = _load_json(args.input)
+    details = [HousingLoanDetailInput(**item) for item in data]
+    _output(
+        ledger_add_housing_loan_details_batch(
+            db_path=args.db_path, fiscal_year=args.fiscal_year, details=details
+        )
+    )
+
+
 def cmd_hl_list(args: argparse.Namespace) -> None:
     _output(ledger_list_housing_loan_details(db_path=args.db_path, fiscal_year=args.fiscal_year))
 
@@ -977,6 +1010,12 @@ def register(parent_subparsers: argparse._SubParsersAction) -> None:
     _add_input_arg(p)
     p.set_defaults(func=cmd_lc_add)
 
+    p = sub.add_parser("lc-add-batch", help="損失繰越一括追加")
+    _add_db_arg(p)
+    _add_fy_arg(p)
+    _add_input_arg(p)
+    p.set_defaults(func=cmd_lc_add_batch)
+
     p = sub.add_parser("lc-list", help="損失繰越一覧")
     _add_db_arg(p)
     _add_fy_arg(p)
@@ -994,6 +1033,12 @@ def register(parent_subparsers: argparse._SubParsersAction) -> None:
     _add_input_arg(p)
     p.set_defaults(func=cmd_me_add)
 
+    p = sub.add_parser("me-add-batch", help="医療費明細一括追加")
+    _add_db_arg(p)
+    _add_fy_arg(p)
+    _add_input_arg(p)
+    p.set_defaults(func=cmd_me_add_batch)
+
     p = sub.add_parser("me-list", help="医療費明細一覧")
     _add_db_arg(p)
     _add_fy_arg(p)
@@ -1028,6 +1073,12 @@ def register(parent_subparsers: argparse._SubParsersAction) -> None:
     _add_input_arg(p)
     p.set_defaults(func=cmd_hl_add)
 
+    p = sub.add_parser("hl-add-batch", help="住宅ローン控除一括追加")
+    _add_db_arg(p)
+    _add_fy_arg(p)
+    _add_input_arg(p)
+    p.set_defaults(func=cmd_hl_add_batch)
+
     p = sub.add_parser("hl-list", help="住宅ローン控除一覧")
     _add_db_arg(p)
     _add_fy_arg(p)
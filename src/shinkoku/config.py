@@ -11,6 +11,12 @@ from pathlib import Path
 import yaml
 from pydantic import BaseModel, Field, model_validator
 
+# libyaml 付きの PyYAML なら C 実装のローダーを使う（無ければ純 Python の SafeLoader）
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 
 class TaxpayerConfig(BaseModel):
     """納税者基本情報。"""
@@ -148,6 +154,6 @@ def load_config(config_path: str) -> ShinkokuConfig:
         raise FileNotFoundError(f"Config file not found: {config_path}")
 
     with open(path, encoding="utf-8") as f:
-        raw = yaml.safe_load(f) or {}
+        raw = yaml.load(f, Loader=_YamlLoader) or {}
 
     return ShinkokuConfig(**raw)
@@ -2,27 +2,65 @@
 
 from __future__ import annotations
 
+import os
 import sqlite3
 from pathlib import Path
 
+from shinkoku.hashing import JOURNAL_HASH_DIGEST_SIZE, compute_journal_hash
+from shinkoku.models import JournalLine
+
 SCHEMA_PATH = Path(__file__).parent / "schema.sql"
 
+# "1" のとき、耐久性・メモリより速度を優先する PRAGMA を追加する（テスト・一括取込向け）
+SQLITE_FAST_ENV = "SHINKOKU_SQLITE_FAST"
+
+# PRAGMA user_version: 1 = journals.content_hash を BLAKE2b に統一済み
+_HASH_MIGRATED_USER_VERSION = 1
+
+
+def _is_uri(db_path: str) -> bool:
+    """Return True if db_path is a SQLite URI filename (file:...)."""
+    return db_path.startswith("file:")
+
 
 def get_connection(db_path: str) -> sqlite3.Connection:
-    """Create a connection with WAL mode and foreign keys enabled."""
-    conn = sqlite3.connect(db_path)
+    """Create a connection with WAL mode and foreign keys enabled.
+
+    The connection runs in autocommit mode (isolation_level=None): single
+    statements commit immediately, and multi-statement writes must open
+    their transaction explicitly with ``conn.execute("BEGIN")``.
+
+    ``db_path`` may also be a SQLite URI (``file:...``), e.g. a shared-cache
+    in-memory database ``file:name?mode=memory&cache=shared``.
+
+    Setting ``SHINKOKU_SQLITE_FAST=1`` opts into a 64 MB page cache, a 256 MB
+    mmap and ``synchronous=NORMAL`` per connection. Under WAL, NORMAL cannot
+    corrupt the database, but the most recent commits can be lost on power
+    failure. By default commits stay fully synced (``synchronous=FULL``); the
+    test suite sets the variable.
+    """
+    conn = sqlite3.connect(db_path, isolation_level=None, uri=_is_uri(db_path))
     conn.execute("PRAGMA journal_mode=WAL")
     conn.execute("PRAGMA foreign_keys=ON")
+    # 試算表・決算書の集計（GROUP BY / ORDER BY）で一時ファイルを作らないようにする
+    conn.execute("PRAGMA temp_store=MEMORY")
+    if os.environ.get(SQLITE_FAST_ENV) == "1":
+        # WAL では NORMAL でも破損しない（電源断時に直近コミットが失われうるのみ）
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA cache_size=-65536")
+        conn.execute("PRAGMA mmap_size=268435456")
     conn.row_factory = sqlite3.Row
     return conn
 
 
 def init_db(db_path: str) -> sqlite3.Connection:
     """Initialize the database: create file, apply schema, return connection."""
-    Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+    if not _is_uri(db_path):
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
     conn = get_connection(db_path)
     schema_sql = SCHEMA_PATH.read_text(encoding="utf-8")
     conn.executescript(schema_sql)
+    conn.execute("BEGIN")
     _migrate(conn)
     conn.commit()
     return conn
@@ -44,3 +82,44 @@ def _migrate(conn: sqlite3.Connection) -> None:
             "ALTER TABLE housing_loan_details "
             "ADD COLUMN cost_for_proration INTEGER NOT NULL DEFAULT 0"
         )
+
+    _rehash_legacy_content_hash(conn)
+
+
+def migrate_legacy_content_hash(conn: sqlite3.Connection) -> None:
+    """旧 SHA-256 の content_hash が残る既存DBを、1度だけ BLAKE2b へ移行する。
+
+    ledger init 以外のコマンドは init_db を経由しないため、content_hash を書き込む
+    処理がトランザクション開始前に呼ぶ。読み取り専用のコマンドからは呼ばない。
+    移行済みかは PRAGMA user_version で判定し、2回目以降は PRAGMA 1回の読み出しのみ。
+    """
+    if conn.execute("PRAGMA user_version").fetchone()[0] >= _HASH_MIGRATED_USER_VERSION:
+        return
+    conn.execute("BEGIN IMMEDIATE")
+    _rehash_legacy_content_hash(conn)
+    conn.commit()
+
+
+def _rehash_legacy_content_hash(conn: sqlite3.Connection) -> None:
+    """SHA-256 (64桁) で保存された旧 content_hash を BLAKE2b で再計算し、移行済みを記録する。
+
+    呼び出し側のトランザクション内で実行する。
+    """
+    legacy = conn.execute(
+        "SELECT id, date FROM journals "
+        "WHERE content_hash IS NOT NULL AND length(content_hash) != ?",
+        (JOURNAL_HASH_DIGEST_SIZE * 2,),
+    ).fetchall()
+    for journal_id, date in legacy:
+        lines = [
+            JournalLine(side=r[0], account_code=r[1], amount=r[2])
+            for r in conn.execute(
+                "SELECT side, account_code, amount FROM journal_lines WHERE journal_id = ?",
+                (journal_id,),
+            ).fetchall()
+        ]
+        conn.execute(
+            "UPDATE journals SET content_hash = ? WHERE id = ?",
+            (compute_journal_hash(date, lines), journal_id),
+        )
+    conn.execute(f"PRAGMA user_version = {_HASH_MIGRATED_USER_VERSION}")
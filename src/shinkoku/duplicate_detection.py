@@ -41,16 +41,17 @@ def check_duplicate_on_insert(
 
     # Check similar: same date + same total amount
     total_debit = sum(ln.amount for ln in entry.lines if ln.side == "debit")
-    rows = conn.execute(
+    similar = conn.execute(
         "SELECT j.id, j.description FROM journals j "
         "INNER JOIN journal_lines jl ON jl.journal_id = j.id "
         "WHERE j.fiscal_year = ? AND j.date = ? AND jl.side = 'debit' "
-        "GROUP BY j.id HAVING SUM(jl.amount) = ?",
+        "GROUP BY j.id HAVING SUM(jl.amount) = ? "
+        "ORDER BY j.id LIMIT 1",
         (fiscal_year, entry.date, total_debit),
-    ).fetchall()
-    if rows:
-        existing_id = rows[0][0]
-        existing_desc = rows[0][1] or ""
+    ).fetchone()
+    if similar:
+        existing_id = similar[0]
+        existing_desc = similar[1] or ""
         return DuplicateWarning(
             match_type="similar",
             score=70,
@@ -6,11 +6,14 @@ import hashlib
 
 from shinkoku.models import JournalLine
 
+JOURNAL_HASH_DIGEST_SIZE = 16
+
 
 def compute_journal_hash(date: str, lines: list[JournalLine]) -> str:
-    """Compute SHA-256 content hash of a journal entry.
+    """Compute BLAKE2b content hash of a journal entry.
 
     Hash is computed from date + normalized (sorted) journal lines.
+    A 16-byte digest is sufficient for the (fiscal_year, content_hash) unique index.
     Description is intentionally excluded — same transaction with different
     descriptions should still be detected as duplicate.
     """
@@ -20,7 +23,7 @@ def compute_journal_hash(date: str, lines: list[JournalLine]) -> str:
     for line in sorted_lines:
         parts.append(f"{line.side}:{line.account_code}:{line.amount}")
     raw = "|".join(parts)
-    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=JOURNAL_HASH_DIGEST_SIZE).hexdigest()
 
 
 def compute_file_hash(file_path: str) -> str:
@@ -5,7 +5,7 @@ from __future__ import annotations
 import json
 import sqlite3
 
-from shinkoku.db import init_db, get_connection
+from shinkoku.db import init_db, get_connection, migrate_legacy_content_hash
 from shinkoku.duplicate_detection import check_duplicate_on_insert, find_duplicate_pairs
 from shinkoku.hashing import compute_journal_hash
 from shinkoku.master_accounts import MASTER_ACCOUNTS
@@ -35,24 +35,30 @@ from shinkoku.models import (
 )
 
 
+# 勘定科目マスタは 1 文の複数行 VALUES でまとめて投入する
+# （約 70 科目 × 5 列で、SQLite のバインド変数上限 999 に収まる）
+_MASTER_ACCOUNTS_INSERT_SQL = (
+    "INSERT OR IGNORE INTO accounts "
+    "(code, name, category, sub_category, tax_category) VALUES "
+    + ", ".join(["(?, ?, ?, ?, ?)"] * len(MASTER_ACCOUNTS))
+)
+_MASTER_ACCOUNTS_PARAMS = tuple(
+    v
+    for a in MASTER_ACCOUNTS
+    for v in (a["code"], a["name"], a["category"], a["sub_category"], a.get("tax_category"))
+)
+
+# 仕訳検索で明細を取得する際、IN 句 1 文あたりの仕訳 ID 数（バインド変数上限 999 未満）
+_SEARCH_LINES_CHUNK_SIZE = 500
+
+
 def ledger_init(*, fiscal_year: int, db_path: str) -> dict:
     """Initialize DB, insert master accounts, create fiscal year."""
     conn = init_db(db_path)
     try:
+        conn.execute("BEGIN")
         # Insert master accounts (idempotent via INSERT OR IGNORE)
-        for a in MASTER_ACCOUNTS:
-            conn.execute(
-                "INSERT OR IGNORE INTO accounts "
-                "(code, name, category, sub_category, tax_category) "
-                "VALUES (?, ?, ?, ?, ?)",
-                (
-                    a["code"],
-                    a["name"],
-                    a["category"],
-                    a["sub_category"],
-                    a.get("tax_category"),
-                ),
-            )
+        conn.execute(_MASTER_ACCOUNTS_INSERT_SQL, _MASTER_ACCOUNTS_PARAMS)
         # Insert fiscal year (idempotent)
         conn.execute(
             "INSERT OR IGNORE INTO fiscal_years (year) VALUES (?)",
@@ -81,7 +87,7 @@ def _validate_journal(
     if row is None:
         return f"Fiscal year {fiscal_year} not found"
 
-    # Check debit == credit balance
+    # Check debit == credit balance（重複チェックより先に判定する）
     debit_total = sum(line.amount for line in entry.lines if line.side == "debit")
     credit_total = sum(line.amount for line in entry.lines if line.side == "credit")
     if debit_total != credit_total:
@@ -99,6 +105,11 @@ def _validate_journal(
     return None
 
 
+def _entry_payload(journal_id: int, fiscal_year: int, entry: JournalEntry) -> dict:
+    """Build the stored journal as returned to the caller, without re-reading the DB."""
+    return {"id": journal_id, "fiscal_year": fiscal_year, **entry.model_dump()}
+
+
 def ledger_add_journal(
     *,
     db_path: str,
@@ -109,6 +120,8 @@ def ledger_add_journal(
     """Add a single journal entry to the ledger."""
     conn = get_connection(db_path)
     try:
+        migrate_legacy_content_hash(conn)
+        conn.execute("BEGIN")
         error = _validate_journal(conn, fiscal_year, entry)
         if error:
             return {"status": "error", "message": error}
@@ -130,15 +143,15 @@ def ledger_add_journal(
                     "duplicate": warning.model_dump(),
                 }
 
-        journal_id = _insert_journal_in_transaction(
-            conn, fiscal_year, entry, content_hash=content_hash
-        )
+        journal_id = _insert_journal_header(conn, fiscal_year, entry, content_hash=content_hash)
+        _insert_journal_lines(conn, _journal_line_rows(journal_id, entry))
 
         conn.commit()
         result: dict = {
             "status": "ok",
             "journal_id": journal_id,
             "fiscal_year": fiscal_year,
+            "entry": _entry_payload(journal_id, fiscal_year, entry),
         }
         if warning and warning.match_type == "similar" and force:
             result["warnings"] = [warning.model_dump()]
@@ -147,13 +160,16 @@ def ledger_add_journal(
         conn.close()
 
 
-def _insert_journal_in_transaction(
+def _insert_journal_header(
     conn: sqlite3.Connection,
     fiscal_year: int,
     entry: JournalEntry,
     content_hash: str | None = None,
 ) -> int:
-    """Insert a journal within an existing transaction. Returns journal_id."""
+    """Insert a journals row (without lines) within an existing transaction.
+
+    Returns journal_id.
+    """
     cursor = conn.execute(
         "INSERT INTO journals "
         "(fiscal_year, date, description, counterparty, source, source_file, "
@@ -170,23 +186,33 @@ def _insert_journal_in_transaction(
         ),
     )
     journal_id: int = cursor.lastrowid  # type: ignore[assignment]
+    return journal_id
 
-    for line in entry.lines:
-        conn.execute(
-            "INSERT INTO journal_lines "
-            "(journal_id, side, account_code, amount, "
-            "tax_category, tax_amount) "
-            "VALUES (?, ?, ?, ?, ?, ?)",
-            (
-                journal_id,
-                line.side,
-                line.account_code,
-                line.amount,
-                line.tax_category,
-                line.tax_amount,
-            ),
+
+def _journal_line_rows(journal_id: int, entry: JournalEntry) -> list[tuple]:
+    """Build the journal_lines INSERT parameters for one entry."""
+    return [
+        (
+            journal_id,
+            line.side,
+            line.account_code,
+            line.amount,
+            line.tax_category,
+            line.tax_amount,
         )
-    return journal_id
+        for line in entry.lines
+    ]
+
+
+def _insert_journal_lines(conn: sqlite3.Connection, rows: list[tuple]) -> None:
+    """Insert journal lines (rows from _journal_line_rows) with one executemany."""
+    conn.executemany(
+        "INSERT INTO journal_lines "
+        "(journal_id, side, account_code, amount, "
+        "tax_category, tax_amount) "
+        "VALUES (?, ?, ?, ?, ?, ?)",
+        rows,
+    )
 
 
 def ledger_add_journals_batch(
@@ -205,6 +231,8 @@ def ledger_add_journals_batch(
 
     conn = get_connection(db_path)
     try:
+        migrate_legacy_content_hash(conn)
+        conn.execute("BEGIN")
         # Validate all entries first
         for i, entry in enumerate(entries):
             error = _validate_journal(conn, fiscal_year, entry)
@@ -217,12 +245,13 @@ def ledger_add_journals_batch(
 
         # 重複チェック: compute hashes and check within-batch + against DB
         hashes: list[str] = []
+        hash_index: dict[str, int] = {}
         warnings: list[dict] = []
         for i, entry in enumerate(entries):
             h = compute_journal_hash(entry.date, entry.lines)
             # バッチ内重複チェック（完全一致はforce=Trueでも常にブロック）
-            if h in hashes:
-                dup_idx = hashes.index(h)
+            if h in hash_index:
+                dup_idx = hash_index[h]
                 return {
                     "status": "error",
                     "message": (
@@ -231,6 +260,7 @@ def ledger_add_journals_batch(
                     "failed_index": i,
                 }
             hashes.append(h)
+            hash_index[h] = i
 
             # DB重複チェック
             warning = check_duplicate_on_insert(conn, fiscal_year, entry)
@@ -257,11 +287,14 @@ def ledger_add_journals_batch(
                         }
                     )
 
-        # Insert all in a single transaction
+        # Insert all in a single transaction (明細は全仕訳分をまとめて executemany)
         journal_ids = []
+        line_rows: list[tuple] = []
         for entry, h in zip(entries, hashes):
-            jid = _insert_journal_in_transaction(conn, fiscal_year, entry, content_hash=h)
+            jid = _insert_journal_header(conn, fiscal_year, entry, content_hash=h)
             journal_ids.append(jid)
+            line_rows.extend(_journal_line_rows(jid, entry))
+        _insert_journal_lines(conn, line_rows)
 
         conn.commit()
         result: dict = {
@@ -334,6 +367,10 @@ def ledger_search(*, db_path: str, params: JournalSearchParams) -> dict:
         count_sql = f"SELECT COUNT(DISTINCT j.id) {base_query}"
         total_count = conn.execute(count_sql, bind_params).fetchone()[0]
 
+        # limit=0 は件数のみの問い合わせとして扱う
+        if params.limit == 0:
+            return {"status": "ok", "journals": [], "total_count": total_count}
+
         # Fetch journal IDs with pagination
         select_sql = (
             f"SELECT DISTINCT j.id, j.fiscal_year, j.date, "
@@ -344,15 +381,24 @@ def ledger_search(*, db_path: str, params: JournalSearchParams) -> dict:
         )
         rows = conn.execute(select_sql, bind_params + [params.limit, params.offset]).fetchall()
 
+        # ページ内の仕訳明細を取得済みの仕訳 ID で絞って取得し、仕訳 ID ごとにまとめる
+        # （検索条件を再実行すると、間に挟まった書き込みで別のページを読みうる）
+        lines_by_journal: dict[int, list] = {row[0]: [] for row in rows}
+        page_ids = list(lines_by_journal)
+        for start in range(0, len(page_ids), _SEARCH_LINES_CHUNK_SIZE):
+            chunk = page_ids[start : start + _SEARCH_LINES_CHUNK_SIZE]
+            lines_sql = (
+                "SELECT journal_id, id, side, account_code, amount, "
+                "tax_category, tax_amount "
+                f"FROM journal_lines WHERE journal_id IN ({', '.join('?' * len(chunk))}) "
+                "ORDER BY id"
+            )
+            for li in conn.execute(lines_sql, chunk):
+                lines_by_journal[li[0]].append(li[1:])
+
         journals = []
         for row in rows:
-            journal_id = row[0]
-            lines = conn.execute(
-                "SELECT id, side, account_code, amount, "
-                "tax_category, tax_amount "
-                "FROM journal_lines WHERE journal_id = ?",
-                (journal_id,),
-            ).fetchall()
+            lines = lines_by_journal[row[0]]
 
             journals.append(
                 {
@@ -400,6 +446,8 @@ def ledger_update_journal(
     """
     conn = get_connection(db_path)
     try:
+        migrate_legacy_content_hash(conn)
+        conn.execute("BEGIN")
         # Check journal exists and fetch old data for audit
         old_journal = conn.execute(
             "SELECT id, fiscal_year, date, description, counterparty FROM journals WHERE id = ?",
@@ -506,24 +554,14 @@ def ledger_update_journal(
         )
 
         # Insert new lines
-        for line in entry.lines:
-            conn.execute(
-                "INSERT INTO journal_lines "
-                "(journal_id, side, account_code, amount, "
-                "tax_category, tax_amount) "
-                "VALUES (?, ?, ?, ?, ?, ?)",
-                (
-                    journal_id,
-                    line.side,
-                    line.account_code,
-                    line.amount,
-                    line.tax_category,
-                    line.tax_amount,
-                ),
-            )
+        _insert_journal_lines(conn, _journal_line_rows(journal_id, entry))
 
         conn.commit()
-        return {"status": "ok", "journal_id": journal_id}
+        return {
+            "status": "ok",
+            "journal_id": journal_id,
+            "entry": _entry_payload(journal_id, fiscal_year, entry),
+        }
     finally:
         conn.close()
 
@@ -535,6 +573,7 @@ def ledger_delete_journal(*, db_path: str, journal_id: int) -> dict:
     """
     conn = get_connection(db_path)
     try:
+        conn.execute("BEGIN")
         # Check journal exists and fetch data for audit
         old_journal = conn.execute(
             "SELECT id, fiscal_year, date, description, counterparty FROM journals WHERE id = ?",
@@ -1029,6 +1068,7 @@ def ledger_set_opening_balances_batch(
     """Upsert multiple opening balance records in a single transaction."""
     conn = get_connection(db_path)
     try:
+        conn.execute("BEGIN")
         for b in balances:
             conn.execute(
                 "INSERT INTO opening_balances "
@@ -1306,6 +1346,47 @@ def ledger_add_loss_carryforward(
         conn.close()
 
 
+def ledger_add_loss_carryforwards_batch(
+    *, db_path: str, fiscal_year: int, details: list[LossCarryforwardInput]
+) -> dict:
+    """Add multiple loss carryforward entries in a single transaction.
+
+    All-or-nothing: if any entry is invalid, none are inserted.
+    """
+    for i, detail in enumerate(details):
+        # 青色申告の3年繰越チェック
+        if detail.loss_year < fiscal_year - 3:
+            return {
+                "status": "error",
+                "message": (
+                    f"Entry {i}: 繰越損失の対象は過去3年以内です "
+                    f"(損失年: {detail.loss_year}, 申告年: {fiscal_year})"
+                ),
+                "failed_index": i,
+            }
+    conn = get_connection(db_path)
+    try:
+        conn.execute("BEGIN")
+        ids = [
+            conn.execute(
+                "INSERT INTO loss_carryforward "
+                "(fiscal_year, loss_year, amount, used_amount) "
+                "VALUES (?, ?, ?, 0)",
+                (fiscal_year, d.loss_year, d.amount),
+            ).lastrowid
+            for d in details
+        ]
+        conn.commit()
+        return {
+            "status": "ok",
+            "fiscal_year": fiscal_year,
+            "count": len(ids),
+            "loss_carryforward_ids": ids,
+        }
+    finally:
+        conn.close()
+
+
 def ledger_list_loss_carryforward(*, db_path: str, fiscal_year: int) -> dict:
     """List all loss carryforward entries for a fiscal year."""
     conn = get_connection(db_path)
@@ -1395,6 +1476,42 @@ def ledger_add_medical_expense(
         conn.close()
 
 
+def ledger_add_medical_expenses_batch(
+    *, db_path: str, fiscal_year: int, details: list[MedicalExpenseInput]
+) -> dict:
+    """Add multiple medical expense detail entries in a single transaction."""
+    conn = get_connection(db_path)
+    try:
+        conn.execute("BEGIN")
+        ids = [
+            conn.execute(
+                "INSERT INTO medical_expense_details "
+                "(fiscal_year, date, patient_name, medical_institution, "
+                "amount, insurance_reimbursement, description) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    fiscal_year,
+                    d.date,
+                    d.patient_name,
+                    d.medical_institution,
+                    d.amount,
+                    d.insurance_reimbursement,
+                    d.description,
+                ),
+            ).lastrowid
+            for d in details
+        ]
+        conn.commit()
+        return {
+            "status": "ok",
+            "fiscal_year": fiscal_year,
+            "count": len(ids),
+            "medical_expense_ids": ids,
+        }
+    finally:
+        conn.close()
+
+
 def ledger_list_medical_expenses(*, db_path: str, fiscal_year: int) -> dict:
     """List all medical expense details for a fiscal year."""
     conn = get_connection(db_path)
@@ -1458,6 +1575,28 @@ def ledger_delete_medical_expense(*, db_path: str, medical_expense_id: int) -> d
 # ============================================================
 
 
+def _housing_loan_detail_row(fiscal_year: int, detail: HousingLoanDetailInput) -> tuple:
+    """Build the housing_loan_details INSERT parameters for one detail."""
+    return (
+        fiscal_year,
+        detail.housing_type,
+        detail.housing_category,
+        detail.move_in_date,
+        detail.year_end_balance,
+        1 if detail.is_new_construction else 0,
+        1 if detail.is_childcare_household else 0,
+        1 if detail.has_pre_r6_building_permit else 0,
+        detail.purchase_date,
+        detail.purchase_price,
+        detail.total_floor_area,
+        detail.residential_floor_area,
+        detail.property_number,
+        1 if detail.application_submitted else 0,
+        detail.dual_application_group,
+        detail.cost_for_proration,
+    )
+
+
 def ledger_add_housing_loan_detail(
     *, db_path: str, fiscal_year: int, detail: HousingLoanDetailInput
 ) -> dict:
@@ -1472,24 +1611,7 @@ def ledger_add_housing_loan_detail(
             "total_floor_area, residential_floor_area, property_number, "
             "application_submitted, dual_application_group, cost_for_proration) "
             "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
-            (
-                fiscal_year,
-                detail.housing_type,
-                detail.housing_category,
-                detail.move_in_date,
-                detail.year_end_balance,
-                1 if detail.is_new_construction else 0,
-                1 if detail.is_childcare_household else 0,
-                1 if detail.has_pre_r6_building_permit else 0,
-                detail.purchase_date,
-                detail.purchase_price,
-                detail.total_floor_area,
-                detail.residential_floor_area,
-                detail.property_number,
-                1 if detail.application_submitted else 0,
-                detail.dual_application_group,
-                detail.cost_for_proration,
-            ),
+            _housing_loan_detail_row(fiscal_year, detail),
         )
         conn.commit()
         return {
@@ -1501,6 +1623,37 @@ def ledger_add_housing_loan_detail(
         conn.close()
 
 
+def ledger_add_housing_loan_details_batch(
+    *, db_path: str, fiscal_year: int, details: list[HousingLoanDetailInput]
+) -> dict:
+    """Add multiple housing loan detail entries in a single transaction."""
+    conn = get_connection(db_path)
+    try:
+        conn.execute("BEGIN")
+        ids = [
+            conn.execute(
+                "INSERT INTO housing_loan_details "
+                "(fiscal_year, housing_type, housing_category, move_in_date, "
+                "year_end_balance, is_new_construction, is_childcare_household, "
+                "has_pre_r6_building_permit, purchase_date, purchase_price, "
+                "total_floor_area, residential_floor_area, property_number, "
+                "application_submitted, dual_application_group, cost_for_proration) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                _housing_loan_detail_row(fiscal_year, d),
+            ).lastrowid
+            for d in details
+        ]
+        conn.commit()
+        return {
+            "status": "ok",
+            "fiscal_year": fiscal_year,
+            "count": len(ids),
+            "housing_loan_detail_ids": ids,
+        }
+    finally:
+        conn.close()
+
+
 def ledger_list_housing_loan_details(*, db_path: str, fiscal_year: int) -> dict:
     """List all housing loan details for a fiscal year."""
     conn = get_connection(db_path)
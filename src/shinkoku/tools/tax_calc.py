@@ -10,6 +10,7 @@ Rounding rules:
 
 from __future__ import annotations
 
+from bisect import bisect_left
 from typing import Any
 
 from shinkoku.models import (
@@ -36,6 +37,8 @@ from shinkoku.tax_constants import (
     DEPENDENT_ELDERLY,
     DEPENDENT_ELDERLY_COHABITING,
     DEPENDENT_GENERAL,
+    DEPENDENT_AGE_ELDERLY,
+    DEPENDENT_AGE_MIN,
     DEPENDENT_AGE_SPECIFIC_MAX,
     DEPENDENT_AGE_SPECIFIC_MIN,
     DEPENDENT_INCOME_LIMIT,
@@ -126,12 +129,17 @@ from shinkoku.tax_constants import (
 )
 
 
+# 基礎控除テーブルの所得上限（昇順）。bisect で該当区分を二分探索する
+_BASIC_DEDUCTION_UPPERS = tuple(upper for upper, _ in BASIC_DEDUCTION_TABLE)
+
+
 def calc_basic_deduction(total_income: int) -> int:
     """Calculate basic deduction based on total income (Reiwa 7)."""
-    for upper, deduction in BASIC_DEDUCTION_TABLE:
-        if total_income <= upper:
-            return deduction
-    return 0
+    # bisect_left: total_income <= upper となる最初の区分
+    idx = bisect_left(_BASIC_DEDUCTION_UPPERS, total_income)
+    if idx == len(_BASIC_DEDUCTION_UPPERS):
+        return 0  # 2,500万超
+    return BASIC_DEDUCTION_TABLE[idx][1]
 
 
 # ============================================================
@@ -151,11 +159,11 @@ def calc_salary_deduction(salary_income: int) -> int:
     if salary_income <= 1_900_000:
         return SALARY_DEDUCTION_MIN
     if salary_income <= 3_600_000:
-        return int(salary_income * 30 // 100) + 80_000
+        return salary_income * 30 // 100 + 80_000
     if salary_income <= 6_600_000:
-        return int(salary_income * 20 // 100) + 440_000
+        return salary_income * 20 // 100 + 440_000
     if salary_income <= 8_500_000:
-        return int(salary_income * 10 // 100) + 1_100_000
+        return salary_income * 10 // 100 + 1_100_000
     return SALARY_DEDUCTION_MAX
 
 
@@ -208,15 +216,11 @@ def calc_life_insurance_category(new_premium: int, old_premium: int) -> int:
 
     max(新のみ, 旧のみ, min(新+旧合算, 40,000))
     """
-    new_only = calc_life_insurance_deduction(new_premium) if new_premium > 0 else 0
-    old_only = calc_life_insurance_deduction_old(old_premium) if old_premium > 0 else 0
-
-    if new_premium > 0 and old_premium > 0:
-        combined = min(new_only + old_only, LIFE_INSURANCE_COMBINED_MAX)
-        return max(new_only, old_only, combined)
-    if new_premium > 0:
-        return new_only
-    return old_only
+    # 各関数は保険料0以下で0を返すため、片方のみの場合も同じ式で max が単独側の控除額になる
+    new_only = calc_life_insurance_deduction(new_premium)
+    old_only = calc_life_insurance_deduction_old(old_premium)
+    combined = min(new_only + old_only, LIFE_INSURANCE_COMBINED_MAX)
+    return max(new_only, old_only, combined)
 
 
 def calc_life_insurance_total(
@@ -379,14 +383,10 @@ def calc_spouse_deduction(taxpayer_income: int, spouse_income: int | None) -> in
 # ============================================================
 
 
-def _calc_age(birth_date: str, fiscal_year_end: str = "2025-12-31") -> int:
-    """Calculate age at end of fiscal year from birth_date (YYYY-MM-DD)."""
-    by, bm, bd = (int(x) for x in birth_date.split("-"))
-    ey, em, ed = (int(x) for x in fiscal_year_end.split("-"))
-    age = ey - by
-    if (em, ed) < (bm, bd):
-        age -= 1
-    return age
+def _calc_age(birth_date: str, fiscal_year: int = 2025) -> int:
+    """Calculate age at end of fiscal year (12/31) from birth_date (YYYY-MM-DD)."""
+    # 基準日が 12/31 なので、その年の誕生日は必ず迎えている（月日の比較は不要）
+    return fiscal_year - int(birth_date[:4])
 
 
 def calc_dependents_deduction(
@@ -412,7 +412,6 @@ def calc_dependents_deduction(
     - 同居特別障害者: 75万円
     """
     items: list[DeductionItem] = []
-    fiscal_year_end = f"{fiscal_year}-12-31"
 
     for dep in dependents:
         # 他の納税者の扶養親族 → 二重控除防止のため除外
@@ -423,7 +422,7 @@ def calc_dependents_deduction(
         if dep.relationship == "配偶者":
             continue
 
-        age = _calc_age(dep.birth_date, fiscal_year_end)
+        age = _calc_age(dep.birth_date, fiscal_year)
         is_specific_age = DEPENDENT_AGE_SPECIFIC_MIN <= age < DEPENDENT_AGE_SPECIFIC_MAX
 
         # 所得要件: 19〜22歳は123万まで許容（特定親族特別控除）、それ以外は58万
@@ -435,7 +434,7 @@ def calc_dependents_deduction(
                 continue
 
         # 扶養控除（16歳以上のみ）
-        if age >= 70:
+        if age >= DEPENDENT_AGE_ELDERLY:
             # 老人扶養親族
             if dep.cohabiting:
                 deduction = DEPENDENT_ELDERLY_COHABITING  # 同居老親等
@@ -478,7 +477,7 @@ def calc_dependents_deduction(
                             details=f"{dep.name}（所得{dep.income}円）",
                         )
                     )
-        elif age >= 16:
+        elif age >= DEPENDENT_AGE_MIN:
             # 一般扶養親族
             items.append(
                 DeductionItem(
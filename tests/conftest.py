@@ -1,37 +1,81 @@
 """Root conftest - shared fixtures available to all tests."""
 
+import os
 import sqlite3
 
 import pytest
 
-from shinkoku.db import SCHEMA_PATH
+from shinkoku.db import SCHEMA_PATH, SQLITE_FAST_ENV
 from shinkoku.master_accounts import MASTER_ACCOUNTS
 
+# CLI をサブプロセスで実行するテストにも引き継がれるよう、環境変数で有効にする
+os.environ.setdefault(SQLITE_FAST_ENV, "1")
 
-@pytest.fixture
-def in_memory_db():
-    """In-memory SQLite database with schema applied. For unit tests."""
+
+def _open_image(image: bytes) -> sqlite3.Connection:
+    """Open a fresh in-memory DB from a serialized snapshot."""
     conn = sqlite3.connect(":memory:")
+    conn.deserialize(image)
     conn.execute("PRAGMA foreign_keys=ON")
     conn.row_factory = sqlite3.Row
-    schema_sql = SCHEMA_PATH.read_text(encoding="utf-8")
-    conn.executescript(schema_sql)
+    return conn
+
+
+@pytest.fixture(scope="session")
+def schema_image() -> bytes:
+    """Serialized in-memory DB with the schema applied, built once per session."""
+    conn = sqlite3.connect(":memory:")
+    conn.executescript(SCHEMA_PATH.read_text(encoding="utf-8"))
     conn.commit()
+    image = conn.serialize()
+    conn.close()
+    return image
+
+
+@pytest.fixture(scope="session")
+def accounts_image(schema_image) -> bytes:
+    """Serialized in-memory DB with schema and master accounts, built once per session."""
+    conn = sqlite3.connect(":memory:")
+    conn.deserialize(schema_image)
+    conn.executemany(
+        "INSERT INTO accounts (code, name, category, sub_category, tax_category) "
+        "VALUES (?, ?, ?, ?, ?)",
+        [
+            (a["code"], a["name"], a["category"], a["sub_category"], a["tax_category"])
+            for a in MASTER_ACCOUNTS
+        ],
+    )
+    conn.commit()
+    image = conn.serialize()
+    conn.close()
+    return image
+
+
+@pytest.fixture
+def in_memory_db(schema_image):
+    """In-memory SQLite database with schema applied. For unit tests."""
+    conn = _open_image(schema_image)
     yield conn
     conn.close()
 
 
 @pytest.fixture
-def in_memory_db_with_accounts(in_memory_db):
-    """In-memory DB with master accounts loaded."""
-    for a in MASTER_ACCOUNTS:
-        in_memory_db.execute(
-            "INSERT INTO accounts (code, name, category, sub_category, tax_category) "
-            "VALUES (?, ?, ?, ?, ?)",
-            (a["code"], a["name"], a["category"], a["sub_category"], a["tax_category"]),
-        )
-    in_memory_db.commit()
-    return in_memory_db
+def in_memory_db_with_accounts(accounts_image):
+    """In-memory DB with master accounts loaded (deserialized from the session snapshot)."""
+    conn = _open_image(accounts_image)
+    yield conn
+    conn.close()
+
+
+# (日付, 摘要, ((side, account_code, amount), ...))
+_SAMPLE_JOURNALS = (
+    # 売上 100,000円 (現金)
+    ("2025-01-15", "ウェブ開発報酬", (("debit", "1001", 100000), ("credit", "4001", 100000))),
+    # 通信費 5,000円 (普通預金)
+    ("2025-01-20", "インターネット回線", (("debit", "5140", 5000), ("credit", "1002", 5000))),
+    # 消耗品費 3,000円 (現金)
+    ("2025-02-10", "文房具購入", (("debit", "5190", 3000), ("credit", "1001", 3000))),
+)
 
 
 @pytest.fixture
@@ -40,54 +84,17 @@ def sample_journals(in_memory_db_with_accounts):
     db = in_memory_db_with_accounts
     # Create fiscal year
     db.execute("INSERT INTO fiscal_years (year) VALUES (2025)")
-    # Sample journal 1: 売上 100,000円 (現金)
-    db.execute(
-        "INSERT INTO journals (fiscal_year, date, description, source) "
-        "VALUES (2025, '2025-01-15', 'ウェブ開発報酬', 'manual')"
-    )
-    journal_id_1 = db.execute("SELECT last_insert_rowid()").fetchone()[0]
-    db.execute(
-        "INSERT INTO journal_lines (journal_id, side, account_code, amount) "
-        "VALUES (?, 'debit', '1001', 100000)",
-        (journal_id_1,),
-    )
-    db.execute(
-        "INSERT INTO journal_lines (journal_id, side, account_code, amount) "
-        "VALUES (?, 'credit', '4001', 100000)",
-        (journal_id_1,),
-    )
-    # Sample journal 2: 通信費 5,000円 (普通預金)
-    db.execute(
-        "INSERT INTO journals (fiscal_year, date, description, source) "
-        "VALUES (2025, '2025-01-20', 'インターネット回線', 'manual')"
-    )
-    journal_id_2 = db.execute("SELECT last_insert_rowid()").fetchone()[0]
-    db.execute(
-        "INSERT INTO journal_lines (journal_id, side, account_code, amount) "
-        "VALUES (?, 'debit', '5140', 5000)",
-        (journal_id_2,),
-    )
-    db.execute(
-        "INSERT INTO journal_lines (journal_id, side, account_code, amount) "
-        "VALUES (?, 'credit', '1002', 5000)",
-        (journal_id_2,),
-    )
-    # Sample journal 3: 消耗品費 3,000円 (現金)
-    db.execute(
-        "INSERT INTO journals (fiscal_year, date, description, source) "
-        "VALUES (2025, '2025-02-10', '文房具購入', 'manual')"
-    )
-    journal_id_3 = db.execute("SELECT last_insert_rowid()").fetchone()[0]
-    db.execute(
-        "INSERT INTO journal_lines (journal_id, side, account_code, amount) "
-        "VALUES (?, 'debit', '5190', 3000)",
-        (journal_id_3,),
-    )
-    db.execute(
-        "INSERT INTO journal_lines (journal_id, side, account_code, amount) "
-        "VALUES (?, 'credit', '1001', 3000)",
-        (journal_id_3,),
-    )
+    for date, description, lines in _SAMPLE_JOURNALS:
+        cursor = db.execute(
+            "INSERT INTO journals (fiscal_year, date, description, source) "
+            "VALUES (2025, ?, ?, 'manual')",
+            (date, description),
+        )
+        db.executemany(
+            "INSERT INTO journal_lines (journal_id, side, account_code, amount) "
+            "VALUES (?, ?, ?, ?)",
+            [(cursor.lastrowid, side, code, amount) for side, code, amount in lines],
+        )
     db.commit()
     return db
 
@@ -7,12 +7,14 @@ from shinkoku.master_accounts import MASTER_ACCOUNTS
 
 def load_master_accounts(conn: sqlite3.Connection) -> None:
     """Insert all master accounts into the database."""
-    for a in MASTER_ACCOUNTS:
-        conn.execute(
-            "INSERT OR IGNORE INTO accounts (code, name, category, sub_category, tax_category) "
-            "VALUES (?, ?, ?, ?, ?)",
-            (a["code"], a["name"], a["category"], a["sub_category"], a["tax_category"]),
-        )
+    conn.executemany(
+        "INSERT OR IGNORE INTO accounts (code, name, category, sub_category, tax_category) "
+        "VALUES (?, ?, ?, ?, ?)",
+        (
+            (a["code"], a["name"], a["category"], a["sub_category"], a["tax_category"])
+            for a in MASTER_ACCOUNTS
+        ),
+    )
     conn.commit()
 
 
@@ -51,11 +53,9 @@ def insert_journal(
         (fiscal_year, date, description, source, counterparty),
     )
     journal_id = conn.execute("SELECT last_insert_rowid()").fetchone()[0]
-    for side, account_code, amount in lines:
-        conn.execute(
-            "INSERT INTO journal_lines (journal_id, side, account_code, amount) "
-            "VALUES (?, ?, ?, ?)",
-            (journal_id, side, account_code, amount),
-        )
+    conn.executemany(
+        "INSERT INTO journal_lines (journal_id, side, account_code, amount) VALUES (?, ?, ?, ?)",
+        ((journal_id, side, account_code, amount) for side, account_code, amount in lines),
+    )
     conn.commit()
     return journal_id
@@ -18,11 +18,14 @@ def tmp_db(tmp_path):
 @pytest.fixture
 def tmp_db_with_accounts(tmp_db):
     """Temporary file DB with master accounts loaded."""
-    for a in MASTER_ACCOUNTS:
-        tmp_db.execute(
-            "INSERT INTO accounts (code, name, category, sub_category, tax_category) "
-            "VALUES (?, ?, ?, ?, ?)",
-            (a["code"], a["name"], a["category"], a["sub_category"], a["tax_category"]),
-        )
+    tmp_db.execute("BEGIN")
+    tmp_db.executemany(
+        "INSERT INTO accounts (code, name, category, sub_category, tax_category) "
+        "VALUES (?, ?, ?, ?, ?)",
+        [
+            (a["code"], a["name"], a["category"], a["sub_category"], a["tax_category"])
+            for a in MASTER_ACCOUNTS
+        ],
+    )
     tmp_db.commit()
     return tmp_db
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import json
+import shutil
+import sqlite3
 import subprocess
 import sys
 from pathlib import Path
@@ -13,31 +15,86 @@ import pytest
 PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
 
 
-@pytest.fixture
-def db_path(tmp_path: Path) -> str:
-    """Initialize a test DB via init_db and return its path."""
-    db = str(tmp_path / "test.db")
-    # init_db を直接使用して DB を初期化
+def _memory_uri(name: str) -> str:
+    """Shared-cache in-memory DB URI usable as a ledger_* db_path."""
+    return f"file:{name}?mode=memory&cache=shared"
+
+
+@pytest.fixture(scope="session")
+def template_db(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Initialize a template DB once per session (schema + master accounts + FY2025).
+
+    The DB is built in memory and written out with serialize(), so building the
+    template never waits on disk syncs.
+    """
     sys.path.insert(0, str(PROJECT_ROOT / "src"))
-    from shinkoku.db import init_db
-    from shinkoku.master_accounts import MASTER_ACCOUNTS
-
-    conn = init_db(db)
-    # マスタ勘定科目を投入
-    for a in MASTER_ACCOUNTS:
-        conn.execute(
-            "INSERT OR IGNORE INTO accounts "
-            "(code, name, category, sub_category, tax_category) "
-            "VALUES (?, ?, ?, ?, ?)",
-            (a["code"], a["name"], a["category"], a["sub_category"], a.get("tax_category")),
-        )
-    # テスト用の会計年度を作成
-    conn.execute("INSERT OR IGNORE INTO fiscal_years (year) VALUES (?)", (2025,))
-    conn.commit()
+    from shinkoku.tools.ledger import ledger_init
+
+    uri = _memory_uri("scripts_template")
+    keeper = sqlite3.connect(uri, uri=True)
+    ledger_init(fiscal_year=2025, db_path=uri)
+    db = tmp_path_factory.mktemp("template") / "template.db"
+    db.write_bytes(keeper.serialize())
+    keeper.close()
+    return db
+
+
+@pytest.fixture
+def db_path(tmp_path: Path, template_db: Path) -> str:
+    """Copy the initialized template DB into tmp_path and return its path."""
+    db = tmp_path / "test.db"
+    shutil.copyfile(template_db, db)
+    return str(db)
+
+
+@pytest.fixture
+def ro_conn(db_path: str):
+    """Read-only connection to db_path for checking DB state after a CLI call."""
+    conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    yield conn
     conn.close()
+
+
+# 帳票系テストで共通に使う仕訳（借方 5200 / 貸方 1100 各 1,000 円）
+SAMPLE_JOURNAL: dict[str, Any] = {
+    "date": "2025-01-15",
+    "description": "Test entry",
+    "lines": [
+        {"side": "debit", "account_code": "5200", "amount": 1000},
+        {"side": "credit", "account_code": "1100", "amount": 1000},
+    ],
+}
+# journal_template_db / journal_db_path における SAMPLE_JOURNAL の仕訳 ID
+SAMPLE_JOURNAL_ID = 1
+
+
+@pytest.fixture(scope="session")
+def journal_template_db(tmp_path_factory: pytest.TempPathFactory, template_db: Path) -> Path:
+    """Template DB with SAMPLE_JOURNAL already added, built in memory once per session."""
+    # template_db への依存は src を sys.path に載せるため
+    from shinkoku.models import JournalEntry
+    from shinkoku.tools.ledger import ledger_add_journal, ledger_init
+
+    uri = _memory_uri("scripts_journal_template")
+    keeper = sqlite3.connect(uri, uri=True)
+    ledger_init(fiscal_year=2025, db_path=uri)
+    result = ledger_add_journal(db_path=uri, fiscal_year=2025, entry=JournalEntry(**SAMPLE_JOURNAL))
+    assert result["status"] == "ok"
+    assert result["journal_id"] == SAMPLE_JOURNAL_ID
+    db = tmp_path_factory.mktemp("journal_template") / "template.db"
+    db.write_bytes(keeper.serialize())
+    keeper.close()
     return db
 
 
+@pytest.fixture
+def journal_db_path(tmp_path: Path, journal_template_db: Path) -> str:
+    """Copy the one-journal template DB into tmp_path and return its path."""
+    db = tmp_path / "test.db"
+    shutil.copyfile(journal_template_db, db)
+    return str(db)
+
+
 def run_cli(*args: str) -> subprocess.CompletedProcess[str]:
     """Run the unified shinkoku CLI and return the CompletedProcess."""
     return subprocess.run(
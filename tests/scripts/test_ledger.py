@@ -3,9 +3,13 @@
 from __future__ import annotations
 
 import json
+import shutil
+import sqlite3
 from pathlib import Path
 
-from .conftest import run_cli, write_json
+import pytest
+
+from .conftest import SAMPLE_JOURNAL, SAMPLE_JOURNAL_ID, run_cli, write_json
 
 # ============================================================
 # ヘルパー
@@ -26,18 +30,7 @@ def run_ledger_raw(*args: str):
 
 def add_journal(db: str, tmp: Path, name: str = "j.json") -> dict:
     """Add a simple journal entry and return parsed output."""
-    f = write_json(
-        tmp,
-        {
-            "date": "2025-01-15",
-            "description": "Test entry",
-            "lines": [
-                {"side": "debit", "account_code": "5200", "amount": 1000},
-                {"side": "credit", "account_code": "1100", "amount": 1000},
-            ],
-        },
-        name,
-    )
+    f = write_json(tmp, SAMPLE_JOURNAL, name)
     return run_ledger(
         "journal-add",
         "--db-path",
@@ -78,6 +71,9 @@ class TestJournalAdd:
         out = add_journal(db_path, tmp_path)
         assert out["status"] == "ok"
         assert "journal_id" in out
+        assert out["entry"]["id"] == out["journal_id"]
+        assert out["entry"]["description"] == "Test entry"
+        assert len(out["entry"]["lines"]) == 2
 
     def test_add_unbalanced(self, db_path, tmp_path):
         f = write_json(
@@ -103,6 +99,33 @@ class TestJournalAdd:
         assert out["status"] == "error"
         assert "balanced" in out["message"].lower()
 
+    def test_add_unbalanced_similar_duplicate(self, journal_db_path, tmp_path):
+        """貸借不一致は重複（similar）警告より優先してエラーになる。"""
+        # SAMPLE_JOURNAL と同日・同借方合計（similar 判定の条件）で貸方のみ 1 円不足
+        f = write_json(
+            tmp_path,
+            {
+                "date": "2025-01-15",
+                "description": "Bad",
+                "lines": [
+                    {"side": "debit", "account_code": "5200", "amount": 1000},
+                    {"side": "credit", "account_code": "1100", "amount": 999},
+                ],
+            },
+        )
+        out = run_ledger(
+            "journal-add",
+            "--db-path",
+            journal_db_path,
+            "--fiscal-year",
+            "2025",
+            "--input",
+            f,
+        )
+        assert out["status"] == "error"
+        assert "balanced" in out["message"].lower()
+        assert "duplicate" not in out
+
 
 class TestJournalBatchAdd:
     def test_batch_add(self, db_path, tmp_path):
@@ -139,803 +162,538 @@ class TestJournalBatchAdd:
         assert out["status"] == "ok"
         assert out["count"] == 2
 
-
-class TestSearch:
-    def test_search_empty(self, db_path, tmp_path):
-        f = write_json(tmp_path, {"fiscal_year": 2025})
-        out = run_ledger("search", "--db-path", db_path, "--input", f)
-        assert out["status"] == "ok"
-        assert out["total_count"] == 0
-
-    def test_search_after_add(self, db_path, tmp_path):
-        add_journal(db_path, tmp_path, "j1.json")
-        f = write_json(tmp_path, {"fiscal_year": 2025}, "search.json")
-        out = run_ledger("search", "--db-path", db_path, "--input", f)
-        assert out["status"] == "ok"
-        assert out["total_count"] == 1
-
-
-class TestJournalUpdate:
-    def test_update(self, db_path, tmp_path):
-        added = add_journal(db_path, tmp_path, "j1.json")
-        jid = added["journal_id"]
+    def test_batch_unbalanced_rolls_back(self, db_path, tmp_path, ro_conn):
         f = write_json(
             tmp_path,
-            {
-                "date": "2025-01-20",
-                "description": "Updated",
-                "lines": [
-                    {"side": "debit", "account_code": "5200", "amount": 2000},
-                    {"side": "credit", "account_code": "1100", "amount": 2000},
-                ],
-            },
-            "upd.json",
+            [
+                {
+                    "date": "2025-02-01",
+                    "description": "Batch 1",
+                    "lines": [
+                        {"side": "debit", "account_code": "5200", "amount": 500},
+                        {"side": "credit", "account_code": "1100", "amount": 500},
+                    ],
+                },
+                {
+                    "date": "2025-02-02",
+                    "description": "Batch 2",
+                    "lines": [
+                        {"side": "debit", "account_code": "5300", "amount": 300},
+                        {"side": "credit", "account_code": "1100", "amount": 299},
+                    ],
+                },
+            ],
         )
         out = run_ledger(
-            "journal-update",
+            "journal-batch-add",
             "--db-path",
             db_path,
             "--fiscal-year",
             "2025",
-            "--journal-id",
-            str(jid),
             "--input",
             f,
         )
-        assert out["status"] == "ok"
+        assert out["status"] == "error"
+        assert out["failed_index"] == 1
+        assert "balanced" in out["message"].lower()
 
-    def test_update_nonexistent(self, db_path, tmp_path):
-        f = write_json(
-            tmp_path,
-            {
-                "date": "2025-01-20",
-                "description": "X",
-                "lines": [
-                    {"side": "debit", "account_code": "5200", "amount": 100},
-                    {"side": "credit", "account_code": "1100", "amount": 100},
-                ],
-            },
-        )
+        assert ro_conn.execute("SELECT 1 FROM journals LIMIT 1").fetchone() is None
+
+    def test_batch_unbalanced_duplicate(self, journal_db_path, tmp_path):
+        """DB 内・バッチ内で重複する貸借不一致の行は、重複ではなく貸借不一致で失敗する。"""
+        unbalanced = {
+            "date": "2025-01-15",
+            "description": "Bad",
+            "lines": [
+                {"side": "debit", "account_code": "5200", "amount": 1000},
+                {"side": "credit", "account_code": "1100", "amount": 999},
+            ],
+        }
+        f = write_json(tmp_path, [unbalanced, unbalanced])
         out = run_ledger(
-            "journal-update",
+            "journal-batch-add",
             "--db-path",
-            db_path,
+            journal_db_path,
             "--fiscal-year",
             "2025",
-            "--journal-id",
-            "9999",
             "--input",
             f,
         )
         assert out["status"] == "error"
+        assert out["failed_index"] == 0
+        assert "balanced" in out["message"].lower()
+        assert "duplicate" not in out
 
 
-class TestJournalDelete:
-    def test_delete(self, db_path, tmp_path):
-        added = add_journal(db_path, tmp_path)
-        jid = added["journal_id"]
-        out = run_ledger(
-            "journal-delete",
-            "--db-path",
-            db_path,
-            "--journal-id",
-            str(jid),
-        )
-        assert out["status"] == "ok"
-
-    def test_delete_nonexistent(self, db_path):
-        out = run_ledger(
-            "journal-delete",
-            "--db-path",
-            db_path,
-            "--journal-id",
-            "9999",
-        )
-        assert out["status"] == "error"
-
-
-# ============================================================
-# 財務諸表
-# ============================================================
+@pytest.fixture(scope="class")
+def search_journal_db(tmp_path_factory, journal_template_db):
+    """SAMPLE_JOURNAL 入りの DB をクラスで 1 回だけコピーする（検索は読み取りのみ）。"""
+    db = tmp_path_factory.mktemp("search") / "test.db"
+    shutil.copyfile(journal_template_db, db)
+    return str(db)
 
 
-class TestTrialBalance:
-    def test_empty(self, db_path):
-        out = run_ledger(
-            "trial-balance",
-            "--db-path",
-            db_path,
-            "--fiscal-year",
-            "2025",
-        )
+class TestSearch:
+    def test_search_empty(self, db_path, tmp_path):
+        f = write_json(tmp_path, {"fiscal_year": 2025})
+        out = run_ledger("search", "--db-path", db_path, "--input", f)
         assert out["status"] == "ok"
-        assert out["total_debit"] == 0
+        assert out["total_count"] == 0
 
-    def test_with_journal(self, db_path, tmp_path):
-        add_journal(db_path, tmp_path)
-        out = run_ledger(
-            "trial-balance",
-            "--db-path",
-            db_path,
-            "--fiscal-year",
-            "2025",
-        )
+    def test_search_after_add(self, search_journal_db, tmp_path):
+        f = write_json(tmp_path, {"fiscal_year": 2025}, "search.json")
+        out = run_ledger("search", "--db-path", search_journal_db, "--input", f)
         assert out["status"] == "ok"
-        assert out["total_debit"] == out["total_credit"]
-
+        assert out["total_count"] == 1
 
-class TestPL:
-    def test_pl(self, db_path, tmp_path):
-        add_journal(db_path, tmp_path)
-        out = run_ledger("pl", "--db-path", db_path, "--fiscal-year", "2025")
+    def test_search_count_only(self, search_journal_db, tmp_path):
+        f = write_json(tmp_path, {"fiscal_year": 2025, "limit": 0}, "search.json")
+        out = run_ledger("search", "--db-path", search_journal_db, "--input", f)
         assert out["status"] == "ok"
-        assert "total_expense" in out
-
+        assert out["total_count"] == 1
+        assert out["journals"] == []
 
-class TestBS:
-    def test_bs(self, db_path, tmp_path):
-        add_journal(db_path, tmp_path)
-        out = run_ledger("bs", "--db-path", db_path, "--fiscal-year", "2025")
+    def test_search_lines_per_journal(self, db_path, tmp_path):
+        f = write_json(
+            tmp_path,
+            [
+                {
+                    "date": f"2025-02-0{i}",
+                    "lines": [
+                        {"side": "debit", "account_code": "5200", "amount": amount},
+                        {"side": "credit", "account_code": "1100", "amount": amount},
+                    ],
+                }
+                for i, amount in enumerate([100, 200, 300], start=1)
+            ],
+        )
+        run_ledger("journal-batch-add", "--db-path", db_path, "--fiscal-year", "2025", "--input", f)
+        f = write_json(tmp_path, {"fiscal_year": 2025, "limit": 2, "offset": 1}, "search.json")
+        out = run_ledger("search", "--db-path", db_path, "--input", f)
         assert out["status"] == "ok"
-        assert "total_assets" in out
+        assert out["total_count"] == 3
+        assert [j["date"] for j in out["journals"]] == ["2025-02-02", "2025-02-03"]
+        for j, amount in zip(out["journals"], [200, 300]):
+            assert [li["side"] for li in j["lines"]] == ["debit", "credit"]
+            assert {li["amount"] for li in j["lines"]} == {amount}
 
-
-class TestCheckDuplicates:
-    def test_no_duplicates(self, db_path):
-        out = run_ledger(
-            "check-duplicates",
-            "--db-path",
-            db_path,
-            "--fiscal-year",
-            "2025",
+    def test_search_filtered_page(self, journal_db_path, tmp_path):
+        """明細の条件で絞った検索でも、ページ内の仕訳の全明細が返ること。"""
+        f = write_json(
+            tmp_path,
+            [
+                {
+                    "date": f"2025-02-0{i}",
+                    "lines": [
+                        {"side": "debit", "account_code": code, "amount": amount},
+                        {"side": "credit", "account_code": "1100", "amount": amount},
+                    ],
+                }
+                for i, (code, amount) in enumerate(
+                    [("5200", 100), ("5140", 200), ("5200", 300), ("5200", 400)], start=1
+                )
+            ],
+        )
+        run_ledger(
+            "journal-batch-add", "--db-path", journal_db_path, "--fiscal-year", "2025", "--input", f
+        )
+        # 5200 かつ 200 円以上: SAMPLE_JOURNAL (1000)・02-03 (300)・02-04 (400) の 3 件
+        f = write_json(
+            tmp_path,
+            {
+                "fiscal_year": 2025,
+                "account_code": "5200",
+                "amount_min": 200,
+                "limit": 1,
+                "offset": 1,
+            },
+            "search.json",
         )
+        out = run_ledger("search", "--db-path", journal_db_path, "--input", f)
         assert out["status"] == "ok"
-        assert out["exact_count"] == 0
-
-
-# ============================================================
-# Business Withholding CRUD
-# ============================================================
+        assert out["total_count"] == 3
+        assert [j["date"] for j in out["journals"]] == ["2025-02-03"]
+        lines = out["journals"][0]["lines"]
+        assert [(li["side"], li["account_code"]) for li in lines] == [
+            ("debit", "5200"),
+            ("credit", "1100"),
+        ]
+        assert {li["amount"] for li in lines} == {300}
 
 
-class TestBusinessWithholding:
-    def test_add_list_delete(self, db_path, tmp_path):
+class TestJournalUpdate:
+    def test_update(self, journal_db_path, tmp_path):
+        jid = SAMPLE_JOURNAL_ID
         f = write_json(
             tmp_path,
             {
-                "client_name": "Acme Corp",
-                "gross_amount": 100000,
-                "withholding_tax": 10210,
+                "date": "2025-01-20",
+                "description": "Updated",
+                "lines": [
+                    {"side": "debit", "account_code": "5200", "amount": 2000},
+                    {"side": "credit", "account_code": "1100", "amount": 2000},
+                ],
             },
+            "upd.json",
         )
         out = run_ledger(
-            "bw-add",
+            "journal-update",
             "--db-path",
-            db_path,
+            journal_db_path,
             "--fiscal-year",
             "2025",
+            "--journal-id",
+            str(jid),
             "--input",
             f,
         )
         assert out["status"] == "ok"
-        wid = out["withholding_id"]
-
-        out = run_ledger(
-            "bw-list",
-            "--db-path",
-            db_path,
-            "--fiscal-year",
-            "2025",
-        )
-        assert out["status"] == "ok"
-        assert out["count"] == 1
-
-        out = run_ledger(
-            "bw-delete",
-            "--db-path",
-            db_path,
-            "--withholding-id",
-            str(wid),
-        )
-        assert out["status"] == "ok"
-
-
-# ============================================================
-# Loss Carryforward CRUD
-# ============================================================
+        assert out["entry"]["id"] == jid
+        assert out["entry"]["date"] == "2025-01-20"
+        assert [li["amount"] for li in out["entry"]["lines"]] == [2000, 2000]
 
-
-class TestLossCarryforward:
-    def test_add_list_delete(self, db_path, tmp_path):
+    def test_update_unbalanced(self, journal_db_path, tmp_path):
+        jid = SAMPLE_JOURNAL_ID
         f = write_json(
             tmp_path,
             {
-                "loss_year": 2023,
-                "amount": 500000,
+                "date": "2025-01-20",
+                "description": "Updated",
+                "lines": [
+                    {"side": "debit", "account_code": "5200", "amount": 2000},
+                    {"side": "credit", "account_code": "1100", "amount": 1999},
+                ],
             },
+            "upd.json",
         )
         out = run_ledger(
-            "lc-add",
+            "journal-update",
             "--db-path",
-            db_path,
+            journal_db_path,
             "--fiscal-year",
             "2025",
+            "--journal-id",
+            str(jid),
             "--input",
             f,
         )
-        assert out["status"] == "ok"
-        lid = out["loss_carryforward_id"]
-
-        out = run_ledger(
-            "lc-list",
-            "--db-path",
-            db_path,
-            "--fiscal-year",
-            "2025",
-        )
-        assert out["status"] == "ok"
-        assert out["count"] == 1
-
-        out = run_ledger(
-            "lc-delete",
-            "--db-path",
-            db_path,
-            "--loss-carryforward-id",
-            str(lid),
-        )
-        assert out["status"] == "ok"
-
-
-# ============================================================
-# Medical Expense CRUD
-# ============================================================
-
-
-class TestMedicalExpense:
-    def test_add_list_delete(self, db_path, tmp_path):
-        f = write_json(
-            tmp_path,
-            {
-                "date": "2025-03-01",
-                "patient_name": "山田太郎",
-                "medical_institution": "東京病院",
-                "amount": 5000,
-                "insurance_reimbursement": 0,
-            },
-        )
-        out = run_ledger(
-            "me-add",
-            "--db-path",
-            db_path,
-            "--fiscal-year",
-            "2025",
-            "--input",
-            f,
-        )
-        assert out["status"] == "ok"
-        mid = out["medical_expense_id"]
-
-        out = run_ledger(
-            "me-list",
-            "--db-path",
-            db_path,
-            "--fiscal-year",
-            "2025",
-        )
-        assert out["status"] == "ok"
-        assert out["count"] == 1
-
-        out = run_ledger(
-            "me-delete",
-            "--db-path",
-            db_path,
-            "--medical-expense-id",
-            str(mid),
-        )
-        assert out["status"] == "ok"
-
-
-# ============================================================
-# Rent Detail CRUD
-# ============================================================
-
-
-class TestRentDetail:
-    def test_add_list_delete(self, db_path, tmp_path):
-        f = write_json(
-            tmp_path,
-            {
-                "property_type": "事務所",
-                "usage": "事務所",
-                "landlord_name": "田中",
-                "landlord_address": "東京都渋谷区",
-                "monthly_rent": 80000,
-                "annual_rent": 960000,
-                "deposit": 0,
-                "business_ratio": 50,
-            },
-        )
-        out = run_ledger(
-            "rd-add",
-            "--db-path",
-            db_path,
-            "--fiscal-year",
-            "2025",
-            "--input",
-            f,
-        )
-        assert out["status"] == "ok"
-        rid = out["rent_detail_id"]
-
-        out = run_ledger(
-            "rd-list",
-            "--db-path",
-            db_path,
-            "--fiscal-year",
-            "2025",
-        )
-        assert out["status"] == "ok"
-        assert out["count"] == 1
-
-        out = run_ledger(
-            "rd-delete",
-            "--db-path",
-            db_path,
-            "--rent-detail-id",
-            str(rid),
-        )
-        assert out["status"] == "ok"
-
-
-# ============================================================
-# Housing Loan Detail CRUD
-# ============================================================
-
-
-class TestHousingLoanDetail:
-    def test_add_list_delete(self, db_path, tmp_path):
-        f = write_json(
-            tmp_path,
-            {
-                "housing_type": "new_custom",
-                "housing_category": "general",
-                "move_in_date": "2024-04-01",
-                "year_end_balance": 30000000,
-                "is_new_construction": True,
-            },
-        )
-        out = run_ledger(
-            "hl-add",
-            "--db-path",
-            db_path,
-            "--fiscal-year",
-            "2025",
-            "--input",
-            f,
-        )
-        assert out["status"] == "ok"
-        hid = out["housing_loan_detail_id"]
-
-        out = run_ledger(
-            "hl-list",
-            "--db-path",
-            db_path,
-            "--fiscal-year",
-            "2025",
-        )
-        assert out["status"] == "ok"
-        assert out["count"] == 1
-
-        out = run_ledger(
-            "hl-delete",
-            "--db-path",
-            db_path,
-            "--housing-loan-detail-id",
-            str(hid),
-        )
-        assert out["status"] == "ok"
-
-
-# ============================================================
-# Spouse CRUD
-# ============================================================
-
-
-class TestSpouse:
-    def test_set_get_delete(self, db_path, tmp_path):
-        f = write_json(
-            tmp_path,
-            {
-                "name": "山田花子",
-                "date_of_birth": "1990-05-15",
-                "income": 500000,
-            },
-        )
-        out = run_ledger(
-            "spouse-set",
-            "--db-path",
-            db_path,
-            "--fiscal-year",
-            "2025",
-            "--input",
-            f,
-        )
-        assert out["status"] == "ok"
-
-        out = run_ledger(
-            "spouse-get",
-            "--db-path",
-            db_path,
-            "--fiscal-year",
-            "2025",
-        )
-        assert out["status"] == "ok"
-        assert out["spouse"]["name"] == "山田花子"
-
-        out = run_ledger(
-            "spouse-delete",
-            "--db-path",
-            db_path,
-            "--fiscal-year",
-            "2025",
-        )
-        assert out["status"] == "ok"
-
-
-# ============================================================
-# Dependent CRUD
-# ============================================================
-
-
-class TestDependent:
-    def test_add_list_delete(self, db_path, tmp_path):
-        f = write_json(
-            tmp_path,
-            {
-                "name": "山田一郎",
-                "relationship": "子",
-                "date_of_birth": "2015-08-10",
-                "income": 0,
-            },
-        )
-        out = run_ledger(
-            "dep-add",
-            "--db-path",
-            db_path,
-            "--fiscal-year",
-            "2025",
-            "--input",
-            f,
-        )
-        assert out["status"] == "ok"
-        did = out["dependent_id"]
-
-        out = run_ledger(
-            "dep-list",
-            "--db-path",
-            db_path,
-            "--fiscal-year",
-            "2025",
-        )
-        assert out["status"] == "ok"
-        assert out["count"] == 1
-
-        out = run_ledger(
-            "dep-delete",
-            "--db-path",
-            db_path,
-            "--dependent-id",
-            str(did),
-        )
-        assert out["status"] == "ok"
-
-
-# ============================================================
-# Withholding Slip CRUD
-# ============================================================
-
-
-class TestWithholdingSlip:
-    def test_save_list_delete(self, db_path, tmp_path):
-        f = write_json(
-            tmp_path,
-            {
-                "payer_name": "株式会社テスト",
-                "payment_amount": 5000000,
-                "withheld_tax": 150000,
-                "social_insurance": 700000,
-            },
-        )
-        out = run_ledger(
-            "ws-save",
-            "--db-path",
-            db_path,
-            "--fiscal-year",
-            "2025",
-            "--input",
-            f,
-        )
-        assert out["status"] == "ok"
-        wid = out["withholding_slip_id"]
-
-        out = run_ledger(
-            "ws-list",
-            "--db-path",
-            db_path,
-            "--fiscal-year",
-            "2025",
-        )
-        assert out["status"] == "ok"
-        assert out["count"] == 1
-
-        out = run_ledger(
-            "ws-delete",
-            "--db-path",
-            db_path,
-            "--withholding-slip-id",
-            str(wid),
-        )
-        assert out["status"] == "ok"
-
-
-# ============================================================
-# Other Income CRUD
-# ============================================================
-
-
-class TestOtherIncome:
-    def test_add_list_delete(self, db_path, tmp_path):
-        f = write_json(
-            tmp_path,
-            {
-                "income_type": "miscellaneous",
-                "description": "副業収入",
-                "revenue": 200000,
-                "expenses": 50000,
-            },
-        )
-        out = run_ledger(
-            "oi-add",
-            "--db-path",
-            db_path,
-            "--fiscal-year",
-            "2025",
-            "--input",
-            f,
-        )
-        assert out["status"] == "ok"
-        oid = out["other_income_id"]
-
-        out = run_ledger(
-            "oi-list",
-            "--db-path",
-            db_path,
-            "--fiscal-year",
-            "2025",
-        )
-        assert out["status"] == "ok"
-        assert out["count"] == 1
-
-        out = run_ledger(
-            "oi-delete",
-            "--db-path",
-            db_path,
-            "--other-income-id",
-            str(oid),
-        )
-        assert out["status"] == "ok"
-
-
-# ============================================================
-# Crypto Income CRUD
-# ============================================================
-
-
-class TestCryptoIncome:
-    def test_add_list_delete(self, db_path, tmp_path):
-        f = write_json(
-            tmp_path,
-            {
-                "exchange_name": "Coincheck",
-                "gains": 100000,
-                "expenses": 5000,
-            },
-        )
-        out = run_ledger(
-            "ci-add",
-            "--db-path",
-            db_path,
-            "--fiscal-year",
-            "2025",
-            "--input",
-            f,
-        )
-        assert out["status"] == "ok"
-        cid = out["crypto_income_id"]
-
-        out = run_ledger(
-            "ci-list",
-            "--db-path",
-            db_path,
-            "--fiscal-year",
-            "2025",
-        )
-        assert out["status"] == "ok"
-        assert out["count"] == 1
-
-        out = run_ledger(
-            "ci-delete",
-            "--db-path",
-            db_path,
-            "--crypto-income-id",
-            str(cid),
-        )
-        assert out["status"] == "ok"
-
-
-# ============================================================
-# Inventory CRUD
-# ============================================================
-
-
-class TestInventory:
-    def test_set_list_delete(self, db_path, tmp_path):
-        f = write_json(
-            tmp_path,
-            {
-                "period": "ending",
-                "amount": 150000,
-                "method": "cost",
-            },
-        )
-        out = run_ledger(
-            "inv-set",
-            "--db-path",
-            db_path,
-            "--fiscal-year",
-            "2025",
-            "--input",
-            f,
-        )
-        assert out["status"] == "ok"
-        assert out["period"] == "ending"
-
-        out = run_ledger(
-            "inv-list",
-            "--db-path",
-            db_path,
-            "--fiscal-year",
-            "2025",
-        )
-        assert out["status"] == "ok"
-        assert out["count"] >= 1
-        # inv-set は upsert なので id を list から取得して削除
-        iid = out["records"][0]["id"]
-
-        out = run_ledger(
-            "inv-delete",
-            "--db-path",
-            db_path,
-            "--inventory-id",
-            str(iid),
-        )
-        assert out["status"] == "ok"
-
-
-# ============================================================
-# Professional Fee CRUD
-# ============================================================
+        assert out["status"] == "error"
+        assert "balanced" in out["message"].lower()
 
+        conn = sqlite3.connect(f"file:{journal_db_path}?mode=ro", uri=True)
+        amounts = conn.execute(
+            "SELECT amount FROM journal_lines WHERE journal_id = ?", (jid,)
+        ).fetchall()
+        conn.close()
+        assert amounts == [(1000,), (1000,)]
 
-class TestProfessionalFee:
-    def test_add_list_delete(self, db_path, tmp_path):
+    def test_update_nonexistent(self, db_path, tmp_path):
         f = write_json(
             tmp_path,
             {
-                "payer_address": "東京都千代田区",
-                "payer_name": "税理士法人テスト",
-                "fee_amount": 200000,
-                "withheld_tax": 20420,
+                "date": "2025-01-20",
+                "description": "X",
+                "lines": [
+                    {"side": "debit", "account_code": "5200", "amount": 100},
+                    {"side": "credit", "account_code": "1100", "amount": 100},
+                ],
             },
         )
         out = run_ledger(
-            "pf-add",
+            "journal-update",
             "--db-path",
             db_path,
             "--fiscal-year",
             "2025",
+            "--journal-id",
+            "9999",
             "--input",
             f,
         )
-        assert out["status"] == "ok"
-        pid = out["professional_fee_id"]
+        assert out["status"] == "error"
 
+
+class TestJournalDelete:
+    def test_delete(self, journal_db_path):
         out = run_ledger(
-            "pf-list",
+            "journal-delete",
             "--db-path",
-            db_path,
-            "--fiscal-year",
-            "2025",
+            journal_db_path,
+            "--journal-id",
+            str(SAMPLE_JOURNAL_ID),
         )
         assert out["status"] == "ok"
-        assert out["count"] == 1
 
+    def test_delete_nonexistent(self, db_path):
         out = run_ledger(
-            "pf-delete",
+            "journal-delete",
             "--db-path",
             db_path,
-            "--professional-fee-id",
-            str(pid),
+            "--journal-id",
+            "9999",
         )
-        assert out["status"] == "ok"
+        assert out["status"] == "error"
 
 
 # ============================================================
-# Stock Trading Account CRUD
+# 財務諸表
 # ============================================================
 
 
-class TestStockTradingAccount:
-    def test_add_list_delete(self, db_path, tmp_path):
-        f = write_json(
-            tmp_path,
-            {
-                "account_type": "tokutei_withholding",
-                "broker_name": "SBI証券",
-                "gains": 300000,
-                "losses": 50000,
-                "withheld_income_tax": 37968,
-                "withheld_residential_tax": 12500,
-            },
-        )
+@pytest.fixture(scope="module")
+def journal_reports(tmp_path_factory, journal_template_db) -> dict[str, dict]:
+    """サンプル仕訳 1 件の DB に対する trial-balance / pl / bs の JSON 出力（各 1 回だけ実行）。"""
+    db = tmp_path_factory.mktemp("journal_reports") / "test.db"
+    shutil.copyfile(journal_template_db, db)
+    return {
+        cmd: run_ledger(cmd, "--db-path", str(db), "--fiscal-year", "2025")
+        for cmd in ("trial-balance", "pl", "bs")
+    }
+
+
+class TestTrialBalance:
+    def test_empty(self, db_path):
         out = run_ledger(
-            "sta-add",
+            "trial-balance",
             "--db-path",
             db_path,
             "--fiscal-year",
             "2025",
-            "--input",
-            f,
         )
         assert out["status"] == "ok"
-        sid = out["stock_trading_account_id"]
+        assert out["total_debit"] == 0
 
-        out = run_ledger(
-            "sta-list",
-            "--db-path",
-            db_path,
-            "--fiscal-year",
-            "2025",
-        )
+    def test_with_journal(self, journal_reports):
+        out = journal_reports["trial-balance"]
         assert out["status"] == "ok"
-        assert out["count"] == 1
+        assert out["total_debit"] == out["total_credit"] == 1000
+        required = {"account_code", "account_name", "category", "debit_total", "credit_total"}
+        for acct in out["accounts"]:
+            assert required <= acct.keys()
+            assert isinstance(acct["debit_total"], int)
+            assert isinstance(acct["credit_total"], int)
+        assert [a["account_code"] for a in out["accounts"]] == ["1100", "5200"]
+
+
+class TestPL:
+    def test_pl(self, journal_reports):
+        out = journal_reports["pl"]
+        assert out["status"] == "ok"
+        assert out["total_revenue"] == 0
+        assert out["total_expense"] == 1000
+        assert out["net_income"] == -1000
+
+
+class TestBS:
+    def test_bs(self, journal_reports):
+        out = journal_reports["bs"]
+        assert out["status"] == "ok"
+        assert "total_assets" in out
+        assert out["net_income"] == journal_reports["pl"]["net_income"]
 
+
+class TestCheckDuplicates:
+    def test_no_duplicates(self, db_path):
         out = run_ledger(
-            "sta-delete",
+            "check-duplicates",
             "--db-path",
             db_path,
-            "--stock-trading-account-id",
-            str(sid),
+            "--fiscal-year",
+            "2025",
         )
         assert out["status"] == "ok"
+        assert out["exact_count"] == 0
 
 
 # ============================================================
-# Stock Loss Carryforward CRUD
+# Detail CRUD (add / list / delete)
 # ============================================================
 
+# (サブコマンド接頭辞, add の戻り値の ID キー, 入力 JSON)
+CRUD_SCENARIOS = [
+    pytest.param(
+        "bw",
+        "withholding_id",
+        {
+            "client_name": "Acme Corp",
+            "gross_amount": 100000,
+            "withholding_tax": 10210,
+        },
+        id="bw",
+    ),
+    pytest.param(
+        "lc",
+        "loss_carryforward_id",
+        {
+            "loss_year": 2023,
+            "amount": 500000,
+        },
+        id="lc",
+    ),
+    pytest.param(
+        "me",
+        "medical_expense_id",
+        {
+            "date": "2025-03-01",
+            "patient_name": "山田太郎",
+            "medical_institution": "東京病院",
+            "amount": 5000,
+            "insurance_reimbursement": 0,
+        },
+        id="me",
+    ),
+    pytest.param(
+        "rd",
+        "rent_detail_id",
+        {
+            "property_type": "事務所",
+            "usage": "事務所",
+            "landlord_name": "田中",
+            "landlord_address": "東京都渋谷区",
+            "monthly_rent": 80000,
+            "annual_rent": 960000,
+            "deposit": 0,
+            "business_ratio": 50,
+        },
+        id="rd",
+    ),
+    pytest.param(
+        "hl",
+        "housing_loan_detail_id",
+        {
+            "housing_type": "new_custom",
+            "housing_category": "general",
+            "move_in_date": "2024-04-01",
+            "year_end_balance": 30000000,
+            "is_new_construction": True,
+        },
+        id="hl",
+    ),
+    pytest.param(
+        "dep",
+        "dependent_id",
+        {
+            "name": "山田一郎",
+            "relationship": "子",
+            "date_of_birth": "2015-08-10",
+            "income": 0,
+        },
+        id="dep",
+    ),
+    pytest.param(
+        "oi",
+        "other_income_id",
+        {
+            "income_type": "miscellaneous",
+            "description": "副業収入",
+            "revenue": 200000,
+            "expenses": 50000,
+        },
+        id="oi",
+    ),
+    pytest.param(
+        "ci",
+        "crypto_income_id",
+        {
+            "exchange_name": "Coincheck",
+            "gains": 100000,
+            "expenses": 5000,
+        },
+        id="ci",
+    ),
+    pytest.param(
+        "pf",
+        "professional_fee_id",
+        {
+            "payer_address": "東京都千代田区",
+            "payer_name": "税理士法人テスト",
+            "fee_amount": 200000,
+            "withheld_tax": 20420,
+        },
+        id="pf",
+    ),
+    pytest.param(
+        "sta",
+        "stock_trading_account_id",
+        {
+            "account_type": "tokutei_withholding",
+            "broker_name": "SBI証券",
+            "gains": 300000,
+            "losses": 50000,
+            "withheld_income_tax": 37968,
+            "withheld_residential_tax": 12500,
+        },
+        id="sta",
+    ),
+    pytest.param(
+        "slc",
+        "stock_loss_carryforward_id",
+        {
+            "loss_year": 2023,
+            "amount": 200000,
+        },
+        id="slc",
+    ),
+    pytest.param(
+        "fx",
+        "fx_trading_id",
+        {
+            "broker_name": "GMOクリック証券",
+            "realized_gains": 500000,
+            "swap_income": 20000,
+            "expenses": 3000,
+        },
+        id="fx",
+    ),
+    pytest.param(
+        "fxlc",
+        "fx_loss_carryforward_id",
+        {
+            "loss_year": 2024,
+            "amount": 100000,
+        },
+        id="fxlc",
+    ),
+    pytest.param(
+        "si",
+        "social_insurance_item_id",
+        {
+            "insurance_type": "national_health",
+            "name": "国民健康保険",
+            "amount": 450000,
+        },
+        id="si",
+    ),
+    pytest.param(
+        "ip",
+        "insurance_policy_id",
+        {
+            "policy_type": "life_general_new",
+            "company_name": "日本生命",
+            "premium": 80000,
+        },
+        id="ip",
+    ),
+    pytest.param(
+        "don",
+        "donation_id",
+        {
+            "donation_type": "public_interest",
+            "recipient_name": "日本赤十字社",
+            "amount": 10000,
+            "date": "2025-06-01",
+        },
+        id="don",
+    ),
+]
+
 
-class TestStockLossCarryforward:
-    def test_add_list_delete(self, db_path, tmp_path):
-        f = write_json(
-            tmp_path,
-            {
-                "loss_year": 2023,
-                "amount": 200000,
-            },
-        )
+class TestDetailCRUD:
+    @pytest.mark.parametrize("prefix,id_key,payload", CRUD_SCENARIOS)
+    def test_add_list_delete(self, db_path, tmp_path, prefix, id_key, payload):
+        f = write_json(tmp_path, payload)
         out = run_ledger(
-            "slc-add",
+            f"{prefix}-add",
             "--db-path",
             db_path,
             "--fiscal-year",
@@ -944,10 +702,10 @@ class TestStockLossCarryforward:
             f,
         )
         assert out["status"] == "ok"
-        sid = out["stock_loss_carryforward_id"]
+        record_id = out[id_key]
 
         out = run_ledger(
-            "slc-list",
+            f"{prefix}-list",
             "--db-path",
             db_path,
             "--fiscal-year",
@@ -957,33 +715,31 @@ class TestStockLossCarryforward:
         assert out["count"] == 1
 
         out = run_ledger(
-            "slc-delete",
+            f"{prefix}-delete",
             "--db-path",
             db_path,
-            "--stock-loss-carryforward-id",
-            str(sid),
+            "--" + id_key.replace("_", "-"),
+            str(record_id),
         )
         assert out["status"] == "ok"
 
 
 # ============================================================
-# FX Trading CRUD
+# Loss Carryforward batch add
 # ============================================================
 
 
-class TestFXTrading:
-    def test_add_list_delete(self, db_path, tmp_path):
+class TestLossCarryforward:
+    def test_add_batch(self, db_path, tmp_path):
         f = write_json(
             tmp_path,
-            {
-                "broker_name": "GMOクリック証券",
-                "realized_gains": 500000,
-                "swap_income": 20000,
-                "expenses": 3000,
-            },
+            [
+                {"loss_year": 2023, "amount": 500000},
+                {"loss_year": 2024, "amount": 300000},
+            ],
         )
         out = run_ledger(
-            "fx-add",
+            "lc-add-batch",
             "--db-path",
             db_path,
             "--fiscal-year",
@@ -992,44 +748,63 @@ class TestFXTrading:
             f,
         )
         assert out["status"] == "ok"
-        fid = out["fx_trading_id"]
+        assert out["count"] == 2
+        ids = out["loss_carryforward_ids"]
+
+        out = run_ledger("lc-list", "--db-path", db_path, "--fiscal-year", "2025")
+        assert out["count"] == 2
+        assert sorted(d["id"] for d in out["details"]) == sorted(ids)
 
+    def test_add_batch_expired_rolls_back(self, db_path, tmp_path, ro_conn):
+        f = write_json(
+            tmp_path,
+            [
+                {"loss_year": 2023, "amount": 500000},
+                {"loss_year": 2021, "amount": 300000},
+            ],
+        )
         out = run_ledger(
-            "fx-list",
+            "lc-add-batch",
             "--db-path",
             db_path,
             "--fiscal-year",
             "2025",
+            "--input",
+            f,
         )
-        assert out["status"] == "ok"
-        assert out["count"] == 1
+        assert out["status"] == "error"
+        assert out["failed_index"] == 1
 
-        out = run_ledger(
-            "fx-delete",
-            "--db-path",
-            db_path,
-            "--fx-trading-id",
-            str(fid),
-        )
-        assert out["status"] == "ok"
+        assert ro_conn.execute("SELECT 1 FROM loss_carryforward LIMIT 1").fetchone() is None
 
 
 # ============================================================
-# FX Loss Carryforward CRUD
+# Medical Expense batch add
 # ============================================================
 
 
-class TestFXLossCarryforward:
-    def test_add_list_delete(self, db_path, tmp_path):
+class TestMedicalExpense:
+    def test_add_batch(self, db_path, tmp_path):
         f = write_json(
             tmp_path,
-            {
-                "loss_year": 2024,
-                "amount": 100000,
-            },
+            [
+                {
+                    "date": "2025-03-01",
+                    "patient_name": "山田太郎",
+                    "medical_institution": "東京病院",
+                    "amount": 5000,
+                },
+                {
+                    "date": "2025-04-10",
+                    "patient_name": "山田花子",
+                    "medical_institution": "渋谷クリニック",
+                    "amount": 12000,
+                    "insurance_reimbursement": 2000,
+                },
+            ],
         )
         out = run_ledger(
-            "fxlc-add",
+            "me-add-batch",
             "--db-path",
             db_path,
             "--fiscal-year",
@@ -1038,45 +813,74 @@ class TestFXLossCarryforward:
             f,
         )
         assert out["status"] == "ok"
-        fid = out["fx_loss_carryforward_id"]
+        assert out["count"] == 2
+        ids = out["medical_expense_ids"]
 
+        out = run_ledger("me-list", "--db-path", db_path, "--fiscal-year", "2025")
+        assert out["count"] == 2
+        assert sorted(d["id"] for d in out["details"]) == sorted(ids)
+
+
+# ============================================================
+# Housing Loan Detail batch add
+# ============================================================
+
+
+class TestHousingLoanDetail:
+    def test_add_batch(self, db_path, tmp_path):
+        f = write_json(
+            tmp_path,
+            [
+                {
+                    "housing_type": "new_custom",
+                    "housing_category": "general",
+                    "move_in_date": "2024-04-01",
+                    "year_end_balance": 30000000,
+                    "is_new_construction": True,
+                },
+                {
+                    "housing_type": "used",
+                    "housing_category": "general",
+                    "move_in_date": "2025-01-15",
+                    "year_end_balance": 10000000,
+                },
+            ],
+        )
         out = run_ledger(
-            "fxlc-list",
+            "hl-add-batch",
             "--db-path",
             db_path,
             "--fiscal-year",
             "2025",
+            "--input",
+            f,
         )
         assert out["status"] == "ok"
-        assert out["count"] == 1
+        assert out["count"] == 2
+        ids = out["housing_loan_detail_ids"]
 
-        out = run_ledger(
-            "fxlc-delete",
-            "--db-path",
-            db_path,
-            "--fx-loss-carryforward-id",
-            str(fid),
-        )
-        assert out["status"] == "ok"
+        out = run_ledger("hl-list", "--db-path", db_path, "--fiscal-year", "2025")
+        assert out["count"] == 2
+        assert sorted(d["id"] for d in out["details"]) == sorted(ids)
 
 
 # ============================================================
-# Social Insurance Item CRUD
+# Spouse CRUD
 # ============================================================
 
 
-class TestSocialInsuranceItem:
-    def test_add_list_delete(self, db_path, tmp_path):
+class TestSpouse:
+    def test_set_get_delete(self, db_path, tmp_path):
         f = write_json(
             tmp_path,
             {
-                "insurance_type": "national_health",
-                "name": "国民健康保険",
-                "amount": 450000,
+                "name": "山田花子",
+                "date_of_birth": "1990-05-15",
+                "income": 500000,
             },
         )
         out = run_ledger(
-            "si-add",
+            "spouse-set",
             "--db-path",
             db_path,
             "--fiscal-year",
@@ -1085,45 +889,45 @@ class TestSocialInsuranceItem:
             f,
         )
         assert out["status"] == "ok"
-        sid = out["social_insurance_item_id"]
 
         out = run_ledger(
-            "si-list",
+            "spouse-get",
             "--db-path",
             db_path,
             "--fiscal-year",
             "2025",
         )
         assert out["status"] == "ok"
-        assert out["count"] == 1
+        assert out["spouse"]["name"] == "山田花子"
 
         out = run_ledger(
-            "si-delete",
+            "spouse-delete",
             "--db-path",
             db_path,
-            "--social-insurance-item-id",
-            str(sid),
+            "--fiscal-year",
+            "2025",
         )
         assert out["status"] == "ok"
 
 
 # ============================================================
-# Insurance Policy CRUD
+# Withholding Slip CRUD
 # ============================================================
 
 
-class TestInsurancePolicy:
-    def test_add_list_delete(self, db_path, tmp_path):
+class TestWithholdingSlip:
+    def test_save_list_delete(self, db_path, tmp_path):
         f = write_json(
             tmp_path,
             {
-                "policy_type": "life_general_new",
-                "company_name": "日本生命",
-                "premium": 80000,
+                "payer_name": "株式会社テスト",
+                "payment_amount": 5000000,
+                "withheld_tax": 150000,
+                "social_insurance": 700000,
             },
         )
         out = run_ledger(
-            "ip-add",
+            "ws-save",
             "--db-path",
             db_path,
             "--fiscal-year",
@@ -1132,10 +936,10 @@ class TestInsurancePolicy:
             f,
         )
         assert out["status"] == "ok"
-        iid = out["insurance_policy_id"]
+        wid = out["withholding_slip_id"]
 
         out = run_ledger(
-            "ip-list",
+            "ws-list",
             "--db-path",
             db_path,
             "--fiscal-year",
@@ -1145,33 +949,32 @@ class TestInsurancePolicy:
         assert out["count"] == 1
 
         out = run_ledger(
-            "ip-delete",
+            "ws-delete",
             "--db-path",
             db_path,
-            "--insurance-policy-id",
-            str(iid),
+            "--withholding-slip-id",
+            str(wid),
         )
         assert out["status"] == "ok"
 
 
 # ============================================================
-# Donation CRUD
+# Inventory CRUD
 # ============================================================
 
 
-class TestDonation:
-    def test_add_list_delete(self, db_path, tmp_path):
+class TestInventory:
+    def test_set_list_delete(self, db_path, tmp_path):
         f = write_json(
             tmp_path,
             {
-                "donation_type": "public_interest",
-                "recipient_name": "日本赤十字社",
-                "amount": 10000,
-                "date": "2025-06-01",
+                "period": "ending",
+                "amount": 150000,
+                "method": "cost",
             },
         )
         out = run_ledger(
-            "don-add",
+            "inv-set",
             "--db-path",
             db_path,
             "--fiscal-year",
@@ -1180,24 +983,26 @@ class TestDonation:
             f,
         )
         assert out["status"] == "ok"
-        did = out["donation_id"]
+        assert out["period"] == "ending"
 
         out = run_ledger(
-            "don-list",
+            "inv-list",
             "--db-path",
             db_path,
             "--fiscal-year",
             "2025",
         )
         assert out["status"] == "ok"
-        assert out["count"] == 1
+        assert out["count"] >= 1
+        # inv-set は upsert なので id を list から取得して削除
+        iid = out["records"][0]["id"]
 
         out = run_ledger(
-            "don-delete",
+            "inv-delete",
             "--db-path",
             db_path,
-            "--donation-id",
-            str(did),
+            "--inventory-id",
+            str(iid),
         )
         assert out["status"] == "ok"
 
@@ -1342,10 +1147,9 @@ class TestErrorHandling:
 class TestAuditLog:
     """監査ログのテスト。"""
 
-    def test_update_creates_audit_log(self, db_path, tmp_path):
+    def test_update_creates_audit_log(self, journal_db_path, tmp_path):
         """仕訳更新で監査ログが作成されること。"""
-        out = add_journal(db_path, tmp_path)
-        journal_id = out["journal_id"]
+        journal_id = SAMPLE_JOURNAL_ID
         # Update the journal
         f = write_json(
             tmp_path,
@@ -1362,7 +1166,7 @@ class TestAuditLog:
         run_ledger(
             "journal-update",
             "--db-path",
-            db_path,
+            journal_db_path,
             "--fiscal-year",
             "2025",
             "--journal-id",
@@ -1371,29 +1175,27 @@ class TestAuditLog:
             f,
         )
         # Check audit log
-        log = run_ledger("audit-log", "--db-path", db_path, "--journal-id", str(journal_id))
+        log = run_ledger("audit-log", "--db-path", journal_db_path, "--journal-id", str(journal_id))
         assert log["status"] == "ok"
         assert log["total_count"] == 1
         assert log["audit_logs"][0]["operation"] == "update"
         assert log["audit_logs"][0]["before_date"] == "2025-01-15"
         assert log["audit_logs"][0]["after_date"] == "2025-02-01"
 
-    def test_delete_creates_audit_log(self, db_path, tmp_path):
+    def test_delete_creates_audit_log(self, journal_db_path, tmp_path):
         """仕訳削除で監査ログが作成されること。"""
-        out = add_journal(db_path, tmp_path)
-        journal_id = out["journal_id"]
-        run_ledger("journal-delete", "--db-path", db_path, "--journal-id", str(journal_id))
-        log = run_ledger("audit-log", "--db-path", db_path, "--journal-id", str(journal_id))
+        journal_id = SAMPLE_JOURNAL_ID
+        run_ledger("journal-delete", "--db-path", journal_db_path, "--journal-id", str(journal_id))
+        log = run_ledger("audit-log", "--db-path", journal_db_path, "--journal-id", str(journal_id))
         assert log["status"] == "ok"
         assert log["total_count"] == 1
         assert log["audit_logs"][0]["operation"] == "delete"
         assert log["audit_logs"][0]["before_date"] == "2025-01-15"
         assert log["audit_logs"][0]["after_date"] is None
 
-    def test_audit_log_cli_by_journal_id(self, db_path, tmp_path):
+    def test_audit_log_cli_by_journal_id(self, journal_db_path, tmp_path):
         """--journal-id フィルタで特定の仕訳の履歴のみ取得。"""
-        # Add two journals with different data to avoid duplicate detection
-        out1 = add_journal(db_path, tmp_path, "j1.json")
+        # SAMPLE_JOURNAL とは異なる内容の仕訳を追加（重複検出を避ける）
         f2 = write_json(
             tmp_path,
             {
@@ -1409,35 +1211,43 @@ class TestAuditLog:
         out2 = run_ledger(
             "journal-add",
             "--db-path",
-            db_path,
+            journal_db_path,
             "--fiscal-year",
             "2025",
             "--input",
             f2,
         )
         # Delete both
-        run_ledger("journal-delete", "--db-path", db_path, "--journal-id", str(out1["journal_id"]))
-        run_ledger("journal-delete", "--db-path", db_path, "--journal-id", str(out2["journal_id"]))
+        run_ledger(
+            "journal-delete", "--db-path", journal_db_path, "--journal-id", str(SAMPLE_JOURNAL_ID)
+        )
+        run_ledger(
+            "journal-delete", "--db-path", journal_db_path, "--journal-id", str(out2["journal_id"])
+        )
         # Filter by journal_id
-        log = run_ledger("audit-log", "--db-path", db_path, "--journal-id", str(out1["journal_id"]))
+        log = run_ledger(
+            "audit-log", "--db-path", journal_db_path, "--journal-id", str(SAMPLE_JOURNAL_ID)
+        )
         assert log["total_count"] == 1
-        assert log["audit_logs"][0]["journal_id"] == out1["journal_id"]
+        assert log["audit_logs"][0]["journal_id"] == SAMPLE_JOURNAL_ID
 
-    def test_audit_log_cli_by_fiscal_year(self, db_path, tmp_path):
+    def test_audit_log_cli_by_fiscal_year(self, journal_db_path):
         """--fiscal-year フィルタで年度ごとの履歴取得。"""
-        out = add_journal(db_path, tmp_path)
-        run_ledger("journal-delete", "--db-path", db_path, "--journal-id", str(out["journal_id"]))
-        log = run_ledger("audit-log", "--db-path", db_path, "--fiscal-year", "2025")
+        run_ledger(
+            "journal-delete", "--db-path", journal_db_path, "--journal-id", str(SAMPLE_JOURNAL_ID)
+        )
+        log = run_ledger("audit-log", "--db-path", journal_db_path, "--fiscal-year", "2025")
         assert log["status"] == "ok"
         assert log["total_count"] >= 1
         for entry in log["audit_logs"]:
             assert entry["fiscal_year"] == 2025
 
-    def test_audit_log_cli_no_filter(self, db_path, tmp_path):
+    def test_audit_log_cli_no_filter(self, journal_db_path):
         """フィルタなしで全件取得。"""
-        out = add_journal(db_path, tmp_path)
-        run_ledger("journal-delete", "--db-path", db_path, "--journal-id", str(out["journal_id"]))
-        log = run_ledger("audit-log", "--db-path", db_path)
+        run_ledger(
+            "journal-delete", "--db-path", journal_db_path, "--journal-id", str(SAMPLE_JOURNAL_ID)
+        )
+        log = run_ledger("audit-log", "--db-path", journal_db_path)
         assert log["status"] == "ok"
         assert log["total_count"] >= 1
 
@@ -1447,68 +1257,71 @@ class TestAuditLog:
 # ============================================================
 
 
+@pytest.fixture(scope="class")
+def search_db(tmp_path_factory, template_db):
+    """取引先・金額の異なる仕訳を登録した DB をクラスで 1 回だけ作る（検索は読み取りのみ）。
+
+    検索結果だけを見るテストなので、CLI の検証・重複チェックを通さず SQL で直接投入する。
+    """
+    tmp = tmp_path_factory.mktemp("search_advanced")
+    db = tmp / "test.db"
+    shutil.copyfile(template_db, db)
+    entries = [
+        ("株式会社ABC", 3000),
+        ("株式会社XYZ", 500),
+        ("C", 50000),
+    ]
+    conn = sqlite3.connect(db, isolation_level=None)
+    conn.execute("BEGIN")
+    journal_ids = [
+        conn.execute(
+            "INSERT INTO journals (fiscal_year, date, description, counterparty, source) "
+            "VALUES (2025, '2025-03-15', 'Counterparty test', ?, 'manual') RETURNING id",
+            (counterparty,),
+        ).fetchone()[0]
+        for counterparty, _ in entries
+    ]
+    conn.executemany(
+        "INSERT INTO journal_lines (journal_id, side, account_code, amount) VALUES (?, ?, ?, ?)",
+        [
+            (journal_id, side, code, amount)
+            for journal_id, (_, amount) in zip(journal_ids, entries)
+            for side, code in (("debit", "5200"), ("credit", "1100"))
+        ],
+    )
+    conn.execute("COMMIT")
+    conn.close()
+    return str(db)
+
+
 class TestSearchAdvanced:
     """拡張検索のテスト。"""
 
-    def _add_journal_with_counterparty(
-        self, db_path, tmp_path, counterparty, amount=1000, name="j.json"
-    ):
-        f = write_json(
-            tmp_path,
-            {
-                "date": "2025-03-15",
-                "description": "Counterparty test",
-                "counterparty": counterparty,
-                "lines": [
-                    {"side": "debit", "account_code": "5200", "amount": amount},
-                    {"side": "credit", "account_code": "1100", "amount": amount},
-                ],
-            },
-            name,
-        )
-        return run_ledger(
-            "journal-add",
-            "--db-path",
-            db_path,
-            "--fiscal-year",
-            "2025",
-            "--input",
-            f,
-        )
-
-    def test_search_by_counterparty(self, db_path, tmp_path):
+    def test_search_by_counterparty(self, search_db, tmp_path):
         """取引先名で検索できること。"""
-        self._add_journal_with_counterparty(db_path, tmp_path, "株式会社ABC", name="j1.json")
-        self._add_journal_with_counterparty(db_path, tmp_path, "株式会社XYZ", name="j2.json")
         params = write_json(
             tmp_path,
             {"fiscal_year": 2025, "counterparty_contains": "ABC"},
             "search.json",
         )
-        out = run_ledger("search", "--db-path", db_path, "--input", params)
+        out = run_ledger("search", "--db-path", search_db, "--input", params)
         assert out["status"] == "ok"
         assert out["total_count"] == 1
         assert out["journals"][0]["counterparty"] == "株式会社ABC"
 
-    def test_search_by_amount_range(self, db_path, tmp_path):
+    def test_search_by_amount_range(self, search_db, tmp_path):
         """金額範囲で検索できること。"""
-        self._add_journal_with_counterparty(db_path, tmp_path, "A", amount=500, name="j1.json")
-        self._add_journal_with_counterparty(db_path, tmp_path, "B", amount=5000, name="j2.json")
-        self._add_journal_with_counterparty(db_path, tmp_path, "C", amount=50000, name="j3.json")
         params = write_json(
             tmp_path,
             {"fiscal_year": 2025, "amount_min": 1000, "amount_max": 10000},
             "search.json",
         )
-        out = run_ledger("search", "--db-path", db_path, "--input", params)
+        out = run_ledger("search", "--db-path", search_db, "--input", params)
         assert out["status"] == "ok"
         assert out["total_count"] == 1
 
-    def test_search_combined(self, db_path, tmp_path):
+    def test_search_combined(self, search_db, tmp_path):
         """日付+取引先+金額の組合せ検索。"""
-        self._add_journal_with_counterparty(
-            db_path, tmp_path, "株式会社ABC", amount=3000, name="j1.json"
-        )
         params = write_json(
             tmp_path,
             {
@@ -1521,7 +1334,7 @@ class TestSearchAdvanced:
             },
             "search.json",
         )
-        out = run_ledger("search", "--db-path", db_path, "--input", params)
+        out = run_ledger("search", "--db-path", search_db, "--input", params)
         assert out["status"] == "ok"
         assert out["total_count"] == 1
 
@@ -1534,13 +1347,12 @@ class TestSearchAdvanced:
 class TestGeneralLedger:
     """総勘定元帳のテスト。"""
 
-    def test_basic(self, db_path, tmp_path):
+    def test_basic(self, journal_db_path):
         """基本的な仕訳の日付順取得と残高計算。"""
-        add_journal(db_path, tmp_path)
         out = run_ledger(
             "general-ledger",
             "--db-path",
-            db_path,
+            journal_db_path,
             "--fiscal-year",
             "2025",
             "--account-code",
@@ -1575,7 +1387,7 @@ class TestGeneralLedger:
         assert out["opening_balance"] == 0
         assert out["closing_balance"] == 0
 
-    def test_opening_balance(self, db_path, tmp_path):
+    def test_opening_balance(self, journal_db_path, tmp_path):
         """期首残高ありのケース。"""
         # 期首残高を設定
         ob = write_json(
@@ -1586,17 +1398,16 @@ class TestGeneralLedger:
         run_ledger(
             "ob-set",
             "--db-path",
-            db_path,
+            journal_db_path,
             "--fiscal-year",
             "2025",
             "--input",
             ob,
         )
-        add_journal(db_path, tmp_path)
         out = run_ledger(
             "general-ledger",
             "--db-path",
-            db_path,
+            journal_db_path,
             "--fiscal-year",
             "2025",
             "--account-code",
@@ -1669,14 +1480,13 @@ class TestGeneralLedger:
 class TestCsvOutput:
     """CSV 出力のテスト。"""
 
-    def test_search_csv(self, db_path, tmp_path):
+    def test_search_csv(self, journal_db_path, tmp_path):
         """--format csv で CSV 出力されること。"""
-        add_journal(db_path, tmp_path)
         params = write_json(tmp_path, {"fiscal_year": 2025}, "search.json")
         r = run_ledger_raw(
             "search",
             "--db-path",
-            db_path,
+            journal_db_path,
             "--input",
             params,
             "--format",
@@ -1688,13 +1498,12 @@ class TestCsvOutput:
         assert "journal_id" in lines[0]
         assert "account_code" in lines[0]
 
-    def test_trial_balance_csv(self, db_path, tmp_path):
+    def test_trial_balance_csv(self, journal_db_path):
         """残高試算表の CSV 出力。"""
-        add_journal(db_path, tmp_path)
         r = run_ledger_raw(
             "trial-balance",
             "--db-path",
-            db_path,
+            journal_db_path,
             "--fiscal-year",
             "2025",
             "--format",
@@ -1706,13 +1515,12 @@ class TestCsvOutput:
         assert "account_code" in lines[0]
         assert "debit_total" in lines[0]
 
-    def test_general_ledger_csv(self, db_path, tmp_path):
+    def test_general_ledger_csv(self, journal_db_path):
         """総勘定元帳の CSV 出力。"""
-        add_journal(db_path, tmp_path)
         r = run_ledger_raw(
             "general-ledger",
             "--db-path",
-            db_path,
+            journal_db_path,
             "--fiscal-year",
             "2025",
             "--account-code",
@@ -1726,13 +1534,12 @@ class TestCsvOutput:
         assert "journal_id" in lines[0]
         assert "balance" in lines[0]
 
-    def test_pl_csv(self, db_path, tmp_path):
+    def test_pl_csv(self, journal_db_path):
         """損益計算書の CSV 出力。"""
-        add_journal(db_path, tmp_path)
         r = run_ledger_raw(
             "pl",
             "--db-path",
-            db_path,
+            journal_db_path,
             "--fiscal-year",
             "2025",
             "--format",
@@ -1743,13 +1550,12 @@ class TestCsvOutput:
         assert len(lines) >= 2
         assert "category" in lines[0]
 
-    def test_bs_csv(self, db_path, tmp_path):
+    def test_bs_csv(self, journal_db_path):
         """貸借対照表の CSV 出力。"""
-        add_journal(db_path, tmp_path)
         r = run_ledger_raw(
             "bs",
             "--db-path",
-            db_path,
+            journal_db_path,
             "--fiscal-year",
             "2025",
             "--format",
@@ -1760,15 +1566,8 @@ class TestCsvOutput:
         assert len(lines) >= 1  # ヘッダは必ずある
         assert "category" in lines[0]
 
-    def test_default_format_is_json(self, db_path, tmp_path):
+    def test_default_format_is_json(self, journal_reports):
         """デフォルトは JSON 出力のまま。"""
-        add_journal(db_path, tmp_path)
-        out = run_ledger(
-            "trial-balance",
-            "--db-path",
-            db_path,
-            "--fiscal-year",
-            "2025",
-        )
+        out = journal_reports["trial-balance"]
         assert out["status"] == "ok"
         assert "accounts" in out
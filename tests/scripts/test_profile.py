@@ -76,8 +76,9 @@ taxpayer:
     assert result.returncode == 0
     output = json.loads(result.stdout)
     assert output["taxpayer"]["has_my_number"] is True
-    # my_number 自体は出力されない
+    # my_number 自体は出力されない（どのキーの値にも含まれない）
     assert "my_number" not in output["taxpayer"]
+    assert "123456789012" not in result.stdout
 
 
 def test_get_profile_config_not_found(tmp_path: Path):
@@ -2,3 +2,56 @@
 
 # Unit tests primarily use in_memory_db from the root conftest.
 # Additional unit-test-specific fixtures can be added here.
+
+import sqlite3
+import uuid
+
+import pytest
+
+from shinkoku.db import init_db
+
+
+@pytest.fixture
+def mem_db_path():
+    """Schema-initialized shared-cache in-memory DB URI for tools that take a db_path.
+
+    The DB lives as long as the keeper connection, so no file or journal is created.
+    """
+    db_path = f"file:{uuid.uuid4().hex}?mode=memory&cache=shared"
+    keeper = init_db(db_path)
+    yield db_path
+    keeper.close()
+
+
+@pytest.fixture
+def db_path(tmp_path) -> str:
+    """Path (as str) of a not-yet-created SQLite file under tmp_path."""
+    return str(tmp_path / "test.db")
+
+
+@pytest.fixture(scope="session")
+def seeded_template_db(accounts_image):
+    """In-memory template DB (schema + master accounts + FY2025), built once per session.
+
+    Starts from the root conftest's accounts_image, so the master accounts are
+    seeded only once per session for all fixtures.
+    """
+    conn = sqlite3.connect(":memory:")
+    conn.deserialize(accounts_image)
+    conn.execute("INSERT INTO fiscal_years (year) VALUES (2025)")
+    conn.commit()
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+def seeded_db_path(seeded_template_db):
+    """Shared-cache in-memory copy of seeded_template_db, for tools that take a db_path.
+
+    The copy is made with the backup API, so the tests never touch the disk.
+    """
+    db_path = f"file:{uuid.uuid4().hex}?mode=memory&cache=shared"
+    keeper = sqlite3.connect(db_path, uri=True)
+    seeded_template_db.backup(keeper)
+    yield db_path
+    keeper.close()
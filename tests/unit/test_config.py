@@ -26,9 +26,9 @@ def minimal_config_yaml(tmp_path):
     return config_file
 
 
-@pytest.fixture
-def full_config_yaml(tmp_path):
-    """Full config YAML with all sections populated."""
+@pytest.fixture(scope="module")
+def full_config_yaml(tmp_path_factory):
+    """Full config YAML with all sections populated (written once per module)."""
     content = """\
 tax_year: 2025
 db_path: ./test.db
@@ -63,11 +63,17 @@ filing:
   electronic_bookkeeping: true
   tax_office_name: 麹町税務署
 """
-    config_file = tmp_path / "shinkoku.config.yaml"
+    config_file = tmp_path_factory.mktemp("full_config") / "shinkoku.config.yaml"
     config_file.write_text(content, encoding="utf-8")
     return config_file
 
 
+@pytest.fixture(scope="module")
+def full_config(full_config_yaml):
+    """full_config_yaml parsed once per module (the tests only read it)."""
+    return load_config(str(full_config_yaml))
+
+
 class TestLoadMinimalConfig:
     """後方互換: tax_year と db_path のみの最小構成で読み込めることを確認。"""
 
@@ -94,48 +100,41 @@ class TestLoadMinimalConfig:
 class TestLoadFullConfig:
     """全セクションが記載されたフル構成を正しく読み込むことを確認。"""
 
-    def test_taxpayer_name(self, full_config_yaml):
-        cfg = load_config(str(full_config_yaml))
-        assert cfg.taxpayer.last_name == "山田"
-        assert cfg.taxpayer.first_name == "太郎"
-
-    def test_taxpayer_kana(self, full_config_yaml):
-        cfg = load_config(str(full_config_yaml))
-        assert cfg.taxpayer.last_name_kana == "ヤマダ"
-        assert cfg.taxpayer.first_name_kana == "タロウ"
-
-    def test_taxpayer_personal_info(self, full_config_yaml):
-        cfg = load_config(str(full_config_yaml))
-        assert cfg.taxpayer.gender == "male"
-        assert cfg.taxpayer.date_of_birth == "1990-01-15"
-        assert cfg.taxpayer.phone == "03-1234-5678"
-
-    def test_address_fields(self, full_config_yaml):
-        cfg = load_config(str(full_config_yaml))
-        assert cfg.address.postal_code == "100-0001"
-        assert cfg.address.prefecture == "東京都"
-        assert cfg.address.city == "千代田区"
-        assert cfg.address.street == "丸の内1-1-1"
-        assert cfg.address.building == "テストビル3F"
-
-    def test_business_fields(self, full_config_yaml):
-        cfg = load_config(str(full_config_yaml))
-        assert cfg.business.trade_name == "テスト屋"
-        assert cfg.business.industry_type == "情報通信業"
-        assert cfg.business.business_description == "ソフトウェア開発"
-        assert cfg.business.establishment_year == 2020
-
-    def test_filing_fields(self, full_config_yaml):
-        cfg = load_config(str(full_config_yaml))
-        assert cfg.filing.submission_method == "e-tax"
-        assert cfg.filing.return_type == "blue"
-        assert cfg.filing.blue_return_deduction == 650_000
-        assert cfg.filing.electronic_bookkeeping is True
-        assert cfg.filing.tax_office_name == "麹町税務署"
+    def test_taxpayer_name(self, full_config):
+        assert full_config.taxpayer.last_name == "山田"
+        assert full_config.taxpayer.first_name == "太郎"
 
-    def test_output_dir(self, full_config_yaml):
-        cfg = load_config(str(full_config_yaml))
-        assert cfg.output_dir == "./output"
+    def test_taxpayer_kana(self, full_config):
+        assert full_config.taxpayer.last_name_kana == "ヤマダ"
+        assert full_config.taxpayer.first_name_kana == "タロウ"
+
+    def test_taxpayer_personal_info(self, full_config):
+        assert full_config.taxpayer.gender == "male"
+        assert full_config.taxpayer.date_of_birth == "1990-01-15"
+        assert full_config.taxpayer.phone == "03-1234-5678"
+
+    def test_address_fields(self, full_config):
+        assert full_config.address.postal_code == "100-0001"
+        assert full_config.address.prefecture == "東京都"
+        assert full_config.address.city == "千代田区"
+        assert full_config.address.street == "丸の内1-1-1"
+        assert full_config.address.building == "テストビル3F"
+
+    def test_business_fields(self, full_config):
+        assert full_config.business.trade_name == "テスト屋"
+        assert full_config.business.industry_type == "情報通信業"
+        assert full_config.business.business_description == "ソフトウェア開発"
+        assert full_config.business.establishment_year == 2020
+
+    def test_filing_fields(self, full_config):
+        assert full_config.filing.submission_method == "e-tax"
+        assert full_config.filing.return_type == "blue"
+        assert full_config.filing.blue_return_deduction == 650_000
+        assert full_config.filing.electronic_bookkeeping is True
+        assert full_config.filing.tax_office_name == "麹町税務署"
+
+    def test_output_dir(self, full_config):
+        assert full_config.output_dir == "./output"
 
 
 class TestMissingConfigFile:
@@ -246,14 +245,12 @@ class TestDefaultValues:
 class TestMyNumber:
     """マイナンバーフィールドが正しく読み込まれることを確認。"""
 
-    def test_my_number_loaded(self, full_config_yaml):
-        cfg = load_config(str(full_config_yaml))
-        assert cfg.taxpayer.my_number == "123456789012"
+    def test_my_number_loaded(self, full_config):
+        assert full_config.taxpayer.my_number == "123456789012"
 
-    def test_my_number_is_string(self, full_config_yaml):
+    def test_my_number_is_string(self, full_config):
         """マイナンバーは文字列型で保持される（先頭ゼロ対応）。"""
-        cfg = load_config(str(full_config_yaml))
-        assert isinstance(cfg.taxpayer.my_number, str)
+        assert isinstance(full_config.taxpayer.my_number, str)
 
     def test_my_number_none_when_omitted(self, minimal_config_yaml):
         cfg = load_config(str(minimal_config_yaml))
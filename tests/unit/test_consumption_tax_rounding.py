@@ -9,6 +9,7 @@
 
 from __future__ import annotations
 
+import pytest
 
 from shinkoku.models import ConsumptionTaxInput
 from shinkoku.tools.tax_calc import calc_consumption_tax
@@ -17,37 +18,43 @@ from shinkoku.tools.tax_calc import calc_consumption_tax
 class TestTaxableBaseRounding:
     """課税標準額の1,000円未満切捨テスト（国税通則法118条）。"""
 
-    def test_exact_thousand(self) -> None:
-        """税抜金額が1,000の倍数の場合、切捨なし。"""
-        # 1,100,000 (税込) → 1,000,000 (税抜) → 1,000,000 (切捨後)
-        r = calc_consumption_tax(
-            ConsumptionTaxInput(fiscal_year=2025, method="standard", taxable_sales_10=1_100_000)
-        )
-        assert r.taxable_base_10 == 1_000_000
-
-    def test_truncate_below_thousand(self) -> None:
-        """税抜金額に1,000未満の端数がある場合、切捨。"""
-        # 1,234,567 (税込) → 1,122,333 (税抜=1,234,567*100//110) → 1,122,000 (切捨)
-        r = calc_consumption_tax(
-            ConsumptionTaxInput(fiscal_year=2025, method="standard", taxable_sales_10=1_234_567)
-        )
-        assert r.taxable_base_10 == 1_122_000
-
-    def test_reduced_rate_base(self) -> None:
-        """軽減税率8%の課税標準額。"""
-        # 108,000 (税込) → 100,000 (税抜=108,000*100//108) → 100,000 (切捨)
-        r = calc_consumption_tax(
-            ConsumptionTaxInput(fiscal_year=2025, method="standard", taxable_sales_8=108_000)
-        )
-        assert r.taxable_base_8 == 100_000
-
-    def test_reduced_rate_truncation(self) -> None:
-        """軽減税率8%で端数が出るケース。"""
-        # 123,456 (税込) → 114,311 (税抜=123,456*100//108) → 114,000 (切捨)
-        r = calc_consumption_tax(
-            ConsumptionTaxInput(fiscal_year=2025, method="standard", taxable_sales_8=123_456)
-        )
-        assert r.taxable_base_8 == 114_000
+    @pytest.mark.parametrize(
+        ("sales", "field", "expected"),
+        [
+            # 1,100,000 (税込) → 1,000,000 (税抜) → 1,000,000 (切捨なし)
+            pytest.param(
+                {"taxable_sales_10": 1_100_000},
+                "taxable_base_10",
+                1_000_000,
+                id="exact_thousand",
+            ),
+            # 1,234,567 (税込) → 1,122,333 (税抜=1,234,567*100//110) → 1,122,000 (切捨)
+            pytest.param(
+                {"taxable_sales_10": 1_234_567},
+                "taxable_base_10",
+                1_122_000,
+                id="truncate_below_thousand",
+            ),
+            # 軽減税率8%: 108,000 (税込) → 100,000 (税抜=108,000*100//108) → 100,000
+            pytest.param(
+                {"taxable_sales_8": 108_000},
+                "taxable_base_8",
+                100_000,
+                id="reduced_rate_base",
+            ),
+            # 軽減税率8%で端数: 123,456 (税込) → 114,311 (税抜=123,456*100//108) → 114,000
+            pytest.param(
+                {"taxable_sales_8": 123_456},
+                "taxable_base_8",
+                114_000,
+                id="reduced_rate_truncation",
+            ),
+        ],
+    )
+    def test_single_rate_base(self, sales: dict[str, int], field: str, expected: int) -> None:
+        """税率ごとの課税標準額が1,000円未満切捨されること。"""
+        r = calc_consumption_tax(ConsumptionTaxInput(fiscal_year=2025, method="standard", **sales))
+        assert getattr(r, field) == expected
 
     def test_mixed_rates(self) -> None:
         """10%と8%の混在ケース。"""
@@ -1,8 +1,12 @@
+import hashlib
 import sqlite3
 
 import pytest
 
-from shinkoku.db import init_db
+from shinkoku.db import SQLITE_FAST_ENV, get_connection, init_db
+from shinkoku.hashing import compute_journal_hash
+from shinkoku.models import JournalEntry, JournalLine, JournalSearchParams
+from shinkoku.tools.ledger import ledger_add_journal, ledger_search
 
 
 def test_init_db_creates_file(tmp_path):
@@ -12,9 +16,8 @@ def test_init_db_creates_file(tmp_path):
     conn.close()
 
 
-def test_init_db_creates_all_tables(tmp_path):
-    db_path = str(tmp_path / "test.db")
-    conn = init_db(db_path)
+def test_init_db_creates_all_tables():
+    conn = init_db(":memory:")
     cursor = conn.execute("SELECT name FROM sqlite_master WHERE type='table' ORDER BY name")
     tables = {row[0] for row in cursor.fetchall()}
     expected = {
@@ -32,8 +35,7 @@ def test_init_db_creates_all_tables(tmp_path):
     conn.close()
 
 
-def test_init_db_idempotent(tmp_path):
-    db_path = str(tmp_path / "test.db")
+def test_init_db_idempotent(db_path):
     conn1 = init_db(db_path)
     conn1.execute("INSERT INTO fiscal_years (year) VALUES (2025)")
     conn1.commit()
@@ -44,26 +46,23 @@ def test_init_db_idempotent(tmp_path):
     conn2.close()
 
 
-def test_foreign_keys_enabled(tmp_path):
-    db_path = str(tmp_path / "test.db")
-    conn = init_db(db_path)
+def test_foreign_keys_enabled():
+    conn = init_db(":memory:")
     result = conn.execute("PRAGMA foreign_keys").fetchone()
     assert result[0] == 1
     conn.close()
 
 
-def test_wal_mode_enabled(tmp_path):
-    db_path = str(tmp_path / "test.db")
+def test_wal_mode_enabled(db_path):
     conn = init_db(db_path)
     result = conn.execute("PRAGMA journal_mode").fetchone()
     assert result[0] == "wal"
     conn.close()
 
 
-def test_journal_lines_reference_journals(tmp_path):
+def test_journal_lines_reference_journals():
     """journal_lines の foreign key が journals を参照していることを確認。"""
-    db_path = str(tmp_path / "test.db")
-    conn = init_db(db_path)
+    conn = init_db(":memory:")
     # journal_id が存在しない journal_lines は挿入できない
     conn.execute("INSERT INTO accounts (code, name, category) VALUES ('1001', 'cash', 'asset')")
     with pytest.raises(sqlite3.IntegrityError):
@@ -74,10 +73,9 @@ def test_journal_lines_reference_journals(tmp_path):
     conn.close()
 
 
-def test_additional_tables_exist(tmp_path):
+def test_additional_tables_exist():
     """社会保険料・保険契約・寄附金テーブルが存在すること。"""
-    db_path = str(tmp_path / "test.db")
-    conn = init_db(db_path)
+    conn = init_db(":memory:")
     cursor = conn.execute("SELECT name FROM sqlite_master WHERE type='table' ORDER BY name")
     tables = {row[0] for row in cursor.fetchall()}
     expected = {"social_insurance_items", "insurance_policies", "donation_records"}
@@ -85,20 +83,18 @@ def test_additional_tables_exist(tmp_path):
     conn.close()
 
 
-def test_dependents_other_taxpayer_column(tmp_path):
+def test_dependents_other_taxpayer_column():
     """dependents テーブルに other_taxpayer_dependent 列が存在すること。"""
-    db_path = str(tmp_path / "test.db")
-    conn = init_db(db_path)
+    conn = init_db(":memory:")
     cursor = conn.execute("PRAGMA table_info(dependents)")
     columns = {row[1] for row in cursor.fetchall()}
     assert "other_taxpayer_dependent" in columns
     conn.close()
 
 
-def test_housing_loan_detail_columns(tmp_path):
+def test_housing_loan_detail_columns():
     """housing_loan_details テーブルに明細列が存在すること。"""
-    db_path = str(tmp_path / "test.db")
-    conn = init_db(db_path)
+    conn = init_db(":memory:")
     cursor = conn.execute("PRAGMA table_info(housing_loan_details)")
     columns = {row[1] for row in cursor.fetchall()}
     expected_new = {
@@ -113,10 +109,9 @@ def test_housing_loan_detail_columns(tmp_path):
     conn.close()
 
 
-def test_opening_balances_table(tmp_path):
+def test_opening_balances_table():
     """opening_balances テーブルが存在し、UNIQUE 制約が機能すること。"""
-    db_path = str(tmp_path / "test.db")
-    conn = init_db(db_path)
+    conn = init_db(":memory:")
     # テーブル存在確認
     cursor = conn.execute("SELECT name FROM sqlite_master WHERE type='table' ORDER BY name")
     tables = {row[0] for row in cursor.fetchall()}
@@ -133,3 +128,141 @@ def test_opening_balances_table(tmp_path):
             "VALUES (2025, '1001', 200000)"
         )
     conn.close()
+
+
+def test_migrate_recomputes_legacy_content_hash(db_path):
+    """SHA-256 で保存された旧 content_hash が BLAKE2b で再計算されること。"""
+    conn = init_db(db_path)
+    conn.execute("INSERT INTO fiscal_years (year) VALUES (2025)")
+    conn.execute("INSERT INTO accounts (code, name, category) VALUES ('1001', 'cash', 'asset')")
+    conn.execute("INSERT INTO accounts (code, name, category) VALUES ('4001', 'sales', 'revenue')")
+    legacy_hash = hashlib.sha256(b"2025-01-15|credit:4001:1000|debit:1001:1000").hexdigest()
+    conn.execute(
+        "INSERT INTO journals (id, fiscal_year, date, content_hash) "
+        "VALUES (1, 2025, '2025-01-15', ?)",
+        (legacy_hash,),
+    )
+    conn.execute(
+        "INSERT INTO journal_lines (journal_id, side, account_code, amount) "
+        "VALUES (1, 'debit', '1001', 1000), (1, 'credit', '4001', 1000)"
+    )
+    conn.commit()
+    conn.close()
+
+    conn = init_db(db_path)
+    row = conn.execute("SELECT content_hash FROM journals WHERE id = 1").fetchone()
+    expected = compute_journal_hash(
+        "2025-01-15",
+        [
+            JournalLine(side="debit", account_code="1001", amount=1000),
+            JournalLine(side="credit", account_code="4001", amount=1000),
+        ],
+    )
+    assert row[0] == expected
+    conn.close()
+
+
+def _create_legacy_hash_db(db_path: str) -> None:
+    """BLAKE2b 移行前（SHA-256 の content_hash, user_version=0）の DB を作成する。"""
+    conn = init_db(db_path)
+    conn.execute("INSERT INTO fiscal_years (year) VALUES (2025)")
+    conn.execute("INSERT INTO accounts (code, name, category) VALUES ('1001', 'cash', 'asset')")
+    conn.execute("INSERT INTO accounts (code, name, category) VALUES ('4001', 'sales', 'revenue')")
+    legacy_hash = hashlib.sha256(b"2025-01-15|credit:4001:1000|debit:1001:1000").hexdigest()
+    conn.execute(
+        "INSERT INTO journals (id, fiscal_year, date, content_hash) "
+        "VALUES (1, 2025, '2025-01-15', ?)",
+        (legacy_hash,),
+    )
+    conn.execute(
+        "INSERT INTO journal_lines (journal_id, side, account_code, amount) "
+        "VALUES (1, 'debit', '1001', 1000), (1, 'credit', '4001', 1000)"
+    )
+    conn.execute("PRAGMA user_version = 0")
+    conn.close()
+
+
+def test_add_journal_migrates_legacy_content_hash(db_path):
+    """ledger init を経ずに開いた旧DBでも、旧ハッシュの仕訳と完全一致する重複が検出されること。"""
+    _create_legacy_hash_db(db_path)
+
+    entry = JournalEntry(
+        date="2025-01-15",
+        lines=[
+            JournalLine(side="debit", account_code="1001", amount=1000),
+            JournalLine(side="credit", account_code="4001", amount=1000),
+        ],
+    )
+    result = ledger_add_journal(db_path=db_path, fiscal_year=2025, entry=entry, force=True)
+    assert result["status"] == "error"
+    assert result["duplicate"]["match_type"] == "exact"
+
+    conn = get_connection(db_path)
+    assert conn.execute("PRAGMA user_version").fetchone()[0] == 1
+    row = conn.execute("SELECT content_hash FROM journals WHERE id = 1").fetchone()
+    assert row[0] == compute_journal_hash(entry.date, entry.lines)
+    assert conn.execute("SELECT COUNT(*) FROM journals").fetchone()[0] == 1
+    conn.close()
+
+
+def test_read_only_open_skips_legacy_hash_migration(db_path):
+    """読み取り専用で開いた旧DBでも検索でき、移行（書き込み）は行われないこと。"""
+    _create_legacy_hash_db(db_path)
+
+    result = ledger_search(
+        db_path=f"file:{db_path}?mode=ro", params=JournalSearchParams(fiscal_year=2025)
+    )
+    assert result["status"] == "ok"
+    assert result["total_count"] == 1
+
+    conn = get_connection(db_path)
+    assert conn.execute("PRAGMA user_version").fetchone()[0] == 0
+    conn.close()
+
+
+def test_report_pragmas_enabled(db_path, monkeypatch):
+    """集計用の PRAGMA（一時領域メモリ）が設定され、キャッシュ拡大は既定では無効であること。"""
+    monkeypatch.delenv(SQLITE_FAST_ENV, raising=False)
+    # init_db は get_connection の接続を返すので、開き直さずに確認する
+    conn = init_db(db_path)
+    assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2  # MEMORY
+    assert conn.execute("PRAGMA cache_size").fetchone()[0] != -65536
+    assert conn.execute("PRAGMA mmap_size").fetchone()[0] != 268435456
+    conn.close()
+
+
+def test_fast_pragmas_opt_in(db_path, monkeypatch):
+    """SHINKOKU_SQLITE_FAST=1 で page cache 64MB・mmap 256MB が設定されること。"""
+    monkeypatch.setenv(SQLITE_FAST_ENV, "1")
+    conn = init_db(db_path)
+    assert conn.execute("PRAGMA cache_size").fetchone()[0] == -65536
+    assert conn.execute("PRAGMA mmap_size").fetchone()[0] == 268435456
+    conn.close()
+
+
+def test_write_pragmas_enabled(db_path, monkeypatch):
+    """書き込み用の PRAGMA（WAL）が設定され、既定ではコミットごとに同期すること。"""
+    monkeypatch.delenv(SQLITE_FAST_ENV, raising=False)
+    conn = init_db(db_path)
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert conn.execute("PRAGMA synchronous").fetchone()[0] == 2  # FULL
+    conn.close()
+
+
+def test_fast_pragmas_relax_synchronous(db_path, monkeypatch):
+    """SHINKOKU_SQLITE_FAST=1 で synchronous=NORMAL になること。"""
+    monkeypatch.setenv(SQLITE_FAST_ENV, "1")
+    conn = init_db(db_path)
+    assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+    conn.close()
+
+
+def test_shared_cache_memory_uri():
+    """共有キャッシュのインメモリ URI を db_path として扱えること。"""
+    db_path = "file:test_shared_cache_memory_uri?mode=memory&cache=shared"
+    keeper = init_db(db_path)
+    keeper.execute("INSERT INTO fiscal_years (year) VALUES (2025)")
+    conn = get_connection(db_path)
+    assert conn.execute("SELECT year FROM fiscal_years").fetchone()[0] == 2025
+    conn.close()
+    keeper.close()
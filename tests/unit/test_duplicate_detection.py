@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+import sqlite3
+
+import pytest
+
 from shinkoku.duplicate_detection import (
     check_duplicate_on_insert,
     check_source_file_imported,
@@ -29,6 +33,36 @@ def _make_entry(
     )
 
 
+# テストは JournalEntry を変更しないため、モジュール読み込み時に 1 回だけ組み立てて使い回す
+_ENTRY = _make_entry()
+# 同日・同額で勘定科目だけ異なる仕訳（similar 判定用）
+_SIMILAR_ENTRY = _make_entry(debit_code="5190", credit_code="1002")
+# 日付・金額とも異なる仕訳
+_OTHER_ENTRY = _make_entry(date="2025-02-15", amount=20000)
+
+
+@pytest.fixture(scope="class")
+def fy2025_db(accounts_image):
+    """Class-wide in-memory DB with master accounts and fiscal year 2025."""
+    conn = sqlite3.connect(":memory:")
+    conn.deserialize(accounts_image)
+    conn.execute("PRAGMA foreign_keys=ON")
+    conn.row_factory = sqlite3.Row
+    conn.execute("INSERT INTO fiscal_years (year) VALUES (2025)")
+    conn.commit()
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+def db(fy2025_db):
+    """fy2025_db wrapped in a SAVEPOINT that is rolled back after each test."""
+    fy2025_db.execute("SAVEPOINT test")
+    yield fy2025_db
+    fy2025_db.execute("ROLLBACK TO test")
+    fy2025_db.execute("RELEASE test")
+
+
 def _insert_journal(
     db, entry: JournalEntry, fiscal_year: int = 2025, include_hash: bool = True
 ) -> int:
@@ -42,23 +76,16 @@ def _insert_journal(
         (fiscal_year, entry.date, entry.description, content_hash),
     )
     journal_id = cursor.lastrowid
-    for line in entry.lines:
-        db.execute(
-            "INSERT INTO journal_lines (journal_id, side, account_code, amount) "
-            "VALUES (?, ?, ?, ?)",
-            (journal_id, line.side, line.account_code, line.amount),
-        )
-    db.commit()
+    db.executemany(
+        "INSERT INTO journal_lines (journal_id, side, account_code, amount) VALUES (?, ?, ?, ?)",
+        ((journal_id, line.side, line.account_code, line.amount) for line in entry.lines),
+    )
     return journal_id
 
 
 class TestCheckDuplicateOnInsert:
-    def test_exact_duplicate_detected(self, in_memory_db_with_accounts):
-        db = in_memory_db_with_accounts
-        db.execute("INSERT INTO fiscal_years (year) VALUES (2025)")
-        db.commit()
-
-        entry = _make_entry()
+    def test_exact_duplicate_detected(self, db):
+        entry = _ENTRY
         _insert_journal(db, entry)
 
         # Same entry should be detected as exact duplicate
@@ -67,33 +94,25 @@ class TestCheckDuplicateOnInsert:
         assert warning.match_type == "exact"
         assert warning.score == 100
 
-    def test_similar_detected(self, in_memory_db_with_accounts):
+    def test_similar_detected(self, db):
         """Same date + same amount but different accounts -> similar."""
-        db = in_memory_db_with_accounts
-        db.execute("INSERT INTO fiscal_years (year) VALUES (2025)")
-        db.commit()
-
-        entry1 = _make_entry(debit_code="1001", credit_code="4001")
+        entry1 = _ENTRY
         _insert_journal(db, entry1)
 
         # Same date, same amount, different accounts
-        entry2 = _make_entry(debit_code="5190", credit_code="1002")
+        entry2 = _SIMILAR_ENTRY
         warning = check_duplicate_on_insert(db, 2025, entry2)
         assert warning is not None
         assert warning.match_type == "similar"
         assert warning.score == 70
 
-    def test_no_duplicate_clean(self, in_memory_db_with_accounts):
+    def test_no_duplicate_clean(self, db):
         """Different entry should return None."""
-        db = in_memory_db_with_accounts
-        db.execute("INSERT INTO fiscal_years (year) VALUES (2025)")
-        db.commit()
-
-        entry1 = _make_entry(date="2025-01-15", amount=10000)
+        entry1 = _ENTRY
         _insert_journal(db, entry1)
 
         # Different date and amount
-        entry2 = _make_entry(date="2025-02-15", amount=20000)
+        entry2 = _OTHER_ENTRY
         warning = check_duplicate_on_insert(db, 2025, entry2)
         assert warning is None
 
@@ -129,13 +148,9 @@ class TestSourceFileCheck:
 
 
 class TestFindDuplicatePairs:
-    def test_find_duplicate_pairs_legacy_exact(self, in_memory_db_with_accounts):
+    def test_find_duplicate_pairs_legacy_exact(self, db):
         """Legacy entries (NULL hash) with identical content detected via date+amount+accounts."""
-        db = in_memory_db_with_accounts
-        db.execute("INSERT INTO fiscal_years (year) VALUES (2025)")
-        db.commit()
-
-        entry = _make_entry()
+        entry = _ENTRY
         # Legacy data: inserted without content_hash (before duplicate detection was added)
         id1 = _insert_journal(db, entry, include_hash=False)
         id2 = _insert_journal(db, entry, include_hash=False)
@@ -148,14 +163,10 @@ class TestFindDuplicatePairs:
         pair_ids = {(p.journal_id_a, p.journal_id_b) for p in high_score_pairs}
         assert (min(id1, id2), max(id1, id2)) in pair_ids
 
-    def test_find_duplicate_pairs_similar(self, in_memory_db_with_accounts):
+    def test_find_duplicate_pairs_similar(self, db):
         """Same date/amount but different accounts -> score 70-90."""
-        db = in_memory_db_with_accounts
-        db.execute("INSERT INTO fiscal_years (year) VALUES (2025)")
-        db.commit()
-
-        entry1 = _make_entry(debit_code="1001", credit_code="4001")
-        entry2 = _make_entry(debit_code="5190", credit_code="1002")
+        entry1 = _ENTRY
+        entry2 = _SIMILAR_ENTRY
         _insert_journal(db, entry1)
         _insert_journal(db, entry2)
 
@@ -165,15 +176,11 @@ class TestFindDuplicatePairs:
         suspected = [p for p in result.pairs if 70 <= p.score < 100]
         assert len(suspected) >= 1
 
-    def test_find_duplicate_pairs_threshold_filter(self, in_memory_db_with_accounts):
+    def test_find_duplicate_pairs_threshold_filter(self, db):
         """Threshold should filter out low-score pairs."""
-        db = in_memory_db_with_accounts
-        db.execute("INSERT INTO fiscal_years (year) VALUES (2025)")
-        db.commit()
-
         # Two entries with same date/amount but different accounts -> score 70
-        entry1 = _make_entry(debit_code="1001", credit_code="4001")
-        entry2 = _make_entry(debit_code="5190", credit_code="1002")
+        entry1 = _ENTRY
+        entry2 = _SIMILAR_ENTRY
         _insert_journal(db, entry1)
         _insert_journal(db, entry2)
 
@@ -5,18 +5,20 @@ from __future__ import annotations
 from shinkoku.hashing import compute_journal_hash, compute_file_hash
 from shinkoku.models import JournalLine
 
+# 現金 10,000 / 売上 10,000（ハッシュ計算は lines を変更しないので共有してよい）
+SALES_10K_LINES = [
+    JournalLine(side="debit", account_code="1001", amount=10000),
+    JournalLine(side="credit", account_code="4001", amount=10000),
+]
+
 
 class TestComputeJournalHash:
     def test_same_content_same_hash(self):
         """Identical entries produce the same hash."""
-        lines = [
-            JournalLine(side="debit", account_code="1001", amount=10000),
-            JournalLine(side="credit", account_code="4001", amount=10000),
-        ]
-        h1 = compute_journal_hash("2025-01-15", lines)
-        h2 = compute_journal_hash("2025-01-15", lines)
+        h1 = compute_journal_hash("2025-01-15", SALES_10K_LINES)
+        h2 = compute_journal_hash("2025-01-15", SALES_10K_LINES)
         assert h1 == h2
-        assert len(h1) == 64  # SHA-256 hex digest
+        assert len(h1) == 32  # BLAKE2b (16 bytes) hex digest
 
     def test_different_line_order_same_hash(self):
         """Line order doesn't matter — hash is order-independent."""
@@ -36,37 +38,25 @@ class TestComputeJournalHash:
 
     def test_description_excluded_from_hash(self):
         """Different descriptions should not affect the hash (description not in hash)."""
-        lines = [
-            JournalLine(side="debit", account_code="1001", amount=10000),
-            JournalLine(side="credit", account_code="4001", amount=10000),
-        ]
         # compute_journal_hash takes date and lines only, not description
-        h1 = compute_journal_hash("2025-01-15", lines)
-        h2 = compute_journal_hash("2025-01-15", lines)
+        h1 = compute_journal_hash("2025-01-15", SALES_10K_LINES)
+        h2 = compute_journal_hash("2025-01-15", SALES_10K_LINES)
         assert h1 == h2
 
     def test_different_amount_different_hash(self):
         """Different amounts produce different hashes."""
-        lines_a = [
-            JournalLine(side="debit", account_code="1001", amount=10000),
-            JournalLine(side="credit", account_code="4001", amount=10000),
-        ]
         lines_b = [
             JournalLine(side="debit", account_code="1001", amount=20000),
             JournalLine(side="credit", account_code="4001", amount=20000),
         ]
-        h_a = compute_journal_hash("2025-01-15", lines_a)
+        h_a = compute_journal_hash("2025-01-15", SALES_10K_LINES)
         h_b = compute_journal_hash("2025-01-15", lines_b)
         assert h_a != h_b
 
     def test_different_date_different_hash(self):
         """Different dates produce different hashes."""
-        lines = [
-            JournalLine(side="debit", account_code="1001", amount=10000),
-            JournalLine(side="credit", account_code="4001", amount=10000),
-        ]
-        h_a = compute_journal_hash("2025-01-15", lines)
-        h_b = compute_journal_hash("2025-02-15", lines)
+        h_a = compute_journal_hash("2025-01-15", SALES_10K_LINES)
+        h_b = compute_journal_hash("2025-02-15", SALES_10K_LINES)
         assert h_a != h_b
 
 
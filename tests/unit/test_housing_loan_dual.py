@@ -266,18 +266,11 @@ class TestCalcDeductionsDualApplication:
             housing_loan_detail=detail,
         )
 
-        # 新パス（dual_application_group なしの単独）
-        detail_single = HousingLoanDetail(
-            housing_type="used",
-            housing_category="general",
-            move_in_date="2025-04-01",
-            year_end_balance=15_000_000,
-            is_new_construction=False,
-            dual_application_group=None,
-        )
+        # 新パス（dual_application_group なしの単独、同じ明細を使い回す）
+        assert detail.dual_application_group is None
         result_new = calc_deductions(
             total_income=5_000_000,
-            housing_loan_details=[detail_single],
+            housing_loan_details=[detail],
         )
 
         old_hl = [tc for tc in result_old.tax_credits if tc.type == "housing_loan"]
@@ -9,7 +9,9 @@
 
 from __future__ import annotations
 
-from shinkoku.models import IncomeTaxInput
+import pytest
+
+from shinkoku.models import IncomeTaxInput, IncomeTaxResult
 from shinkoku.tools.tax_calc import calc_income_tax
 
 
@@ -132,34 +134,32 @@ class TestPaymentVsRefund:
             assert r.tax_due % 100 == 0
 
 
+@pytest.fixture(scope="module")
+def blue_5m_result() -> IncomeTaxResult:
+    """事業収入500万・青色65万・社保50万の計算結果（復興税テストで共有、1 回だけ計算）。"""
+    return calc_income_tax(
+        IncomeTaxInput(
+            fiscal_year=2025,
+            business_revenue=5_000_000,
+            business_expenses=0,
+            blue_return_deduction=650_000,
+            social_insurance=500_000,
+        )
+    )
+
+
 class TestReconstructionTax:
     """復興特別所得税のテスト。"""
 
-    def test_reconstruction_tax_1yen_truncation(self) -> None:
+    def test_reconstruction_tax_1yen_truncation(self, blue_5m_result: IncomeTaxResult) -> None:
         """復興特別所得税は1円未満切捨。"""
-        r = calc_income_tax(
-            IncomeTaxInput(
-                fiscal_year=2025,
-                business_revenue=5_000_000,
-                business_expenses=0,
-                blue_return_deduction=650_000,
-                social_insurance=500_000,
-            )
-        )
+        r = blue_5m_result
         # reconstruction_tax = income_tax_after_credits * 21 // 1000
         # 整数演算なので自動的に1円未満切捨
         expected = r.income_tax_after_credits * 21 // 1000
         assert r.reconstruction_tax == expected
 
-    def test_total_tax_no_rounding(self) -> None:
+    def test_total_tax_no_rounding(self, blue_5m_result: IncomeTaxResult) -> None:
         """所得税及び復興特別所得税の額（㊺）には端数処理なし。"""
-        r = calc_income_tax(
-            IncomeTaxInput(
-                fiscal_year=2025,
-                business_revenue=5_000_000,
-                business_expenses=0,
-                blue_return_deduction=650_000,
-                social_insurance=500_000,
-            )
-        )
+        r = blue_5m_result
         assert r.total_tax == r.income_tax_after_credits + r.reconstruction_tax
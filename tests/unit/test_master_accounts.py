@@ -1,43 +1,57 @@
 """Tests for master account definitions."""
 
+from types import MappingProxyType
+
 from shinkoku.master_accounts import MASTER_ACCOUNTS
 
+# MASTER_ACCOUNTS から導出する値は import 時に 1 回だけ作る
+_CODES = [a["code"] for a in MASTER_ACCOUNTS]
+_CODE_SET = frozenset(_CODES)
+_CATEGORIES = {a["category"] for a in MASTER_ACCOUNTS}
+_NAMES = {a["name"] for a in MASTER_ACCOUNTS}
+_BY_CATEGORY: dict[str, list[dict]] = {}
+for _a in MASTER_ACCOUNTS:
+    _BY_CATEGORY.setdefault(_a["category"], []).append(_a)
+
+# コード先頭桁 → 区分（1xxx=asset, 2xxx=liability, 3xxx=equity, 4xxx=revenue, 5xxx=expense）
+_PREFIX_CATEGORY = MappingProxyType(
+    {
+        "1": "asset",
+        "2": "liability",
+        "3": "equity",
+        "4": "revenue",
+        "5": "expense",
+    }
+)
+
 
 def test_master_accounts_has_all_categories():
     """All five accounting categories must be present."""
-    categories = {a["category"] for a in MASTER_ACCOUNTS}
-    assert categories == {"asset", "liability", "equity", "revenue", "expense"}
+    assert _CATEGORIES == {"asset", "liability", "equity", "revenue", "expense"}
 
 
 def test_master_accounts_codes_unique():
     """Account codes must be unique."""
-    codes = [a["code"] for a in MASTER_ACCOUNTS]
-    assert len(codes) == len(set(codes)), (
-        f"Duplicate codes found: {len(codes)} vs {len(set(codes))}"
+    assert len(_CODES) == len(_CODE_SET), (
+        f"Duplicate codes found: {len(_CODES)} vs {len(_CODE_SET)}"
     )
 
 
 def test_master_accounts_code_format():
     """All codes must be 4-digit strings."""
-    for a in MASTER_ACCOUNTS:
-        assert len(a["code"]) == 4, f"Code {a['code']} is not 4 digits"
-        assert a["code"].isdigit(), f"Code {a['code']} is not numeric"
+    for code in _CODES:
+        assert len(code) == 4, f"Code {code} is not 4 digits"
+        assert code.isdigit(), f"Code {code} is not numeric"
 
 
 def test_master_accounts_code_ranges():
     """Codes must follow the category convention: 1xxx=asset, 2xxx=liability, 3xxx=equity, 4xxx=revenue, 5xxx=expense."""
-    prefix_map = {
-        "1": "asset",
-        "2": "liability",
-        "3": "equity",
-        "4": "revenue",
-        "5": "expense",
-    }
     for a in MASTER_ACCOUNTS:
         prefix = a["code"][0]
-        assert prefix in prefix_map, f"Code {a['code']} has unexpected prefix {prefix}"
-        assert a["category"] == prefix_map[prefix], (
-            f"Code {a['code']} prefix {prefix} should map to {prefix_map[prefix]} but has {a['category']}"
+        expected = _PREFIX_CATEGORY.get(prefix)
+        assert expected is not None, f"Code {a['code']} has unexpected prefix {prefix}"
+        assert a["category"] == expected, (
+            f"Code {a['code']} prefix {prefix} should map to {expected} but has {a['category']}"
         )
 
 
@@ -61,7 +75,6 @@ def test_master_accounts_required_fields():
 
 def test_master_accounts_has_essential_accounts():
     """Must include key accounts needed for sole proprietor blue return."""
-    names = {a["name"] for a in MASTER_ACCOUNTS}
     essential = {
         "現金",
         "普通預金",
@@ -71,14 +84,14 @@ def test_master_accounts_has_essential_accounts():
         "売上",
         "仕入",
     }
-    missing = essential - names
+    missing = essential - _NAMES
     assert not missing, f"Missing essential accounts: {missing}"
 
 
 def test_master_accounts_sub_categories_present():
     """Each category should have at least one sub_category value."""
     for cat in ("asset", "liability", "equity", "revenue", "expense"):
-        accounts = [a for a in MASTER_ACCOUNTS if a["category"] == cat]
+        accounts = _BY_CATEGORY.get(cat, [])
         sub_cats = {a["sub_category"] for a in accounts}
         assert sub_cats, f"Category {cat} has no sub_categories"
         # sub_category should not be all None
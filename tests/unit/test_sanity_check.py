@@ -5,17 +5,18 @@ from __future__ import annotations
 from shinkoku.models import IncomeTaxInput, IncomeTaxResult
 from shinkoku.tools.tax_calc import sanity_check_income_tax
 
+# 既定値のモデルは 1 回だけ検証し、各テストでは model_copy で差分だけ上書きする
+# （上書きする値は int のみで、sanity_check_income_tax は入力を変更しない）
+_BASE_INPUT = IncomeTaxInput(fiscal_year=2025)
+_BASE_RESULT = IncomeTaxResult(fiscal_year=2025, tax_due=0)
+
 
 def _make_input(**kwargs) -> IncomeTaxInput:
-    defaults = {"fiscal_year": 2025}
-    defaults.update(kwargs)
-    return IncomeTaxInput(**defaults)
+    return _BASE_INPUT.model_copy(update=kwargs)
 
 
 def _make_result(**kwargs) -> IncomeTaxResult:
-    defaults = {"fiscal_year": 2025, "tax_due": 0}
-    defaults.update(kwargs)
-    return IncomeTaxResult(**defaults)
+    return _BASE_RESULT.model_copy(update=kwargs)
 
 
 # --- 1. BLUE_DEDUCTION_ON_LOSS ---